@@ -220,3 +220,17 @@ def test_iterator_with_after(collection_factory: CollectionFactory) -> None:
         next(iterator).properties["data"]
         == collection.query.fetch_object_by_id(uuids[6]).properties["data"]
     )
+
+
+@pytest.mark.parametrize("cache_size", [1, 7, 1000])
+def test_iterator_with_cache_size(collection_factory: CollectionFactory, cache_size: int) -> None:
+    collection = collection_factory(
+        properties=[Property(name="data", data_type=DataType.INT)],
+        vectorizer_config=Configure.Vectorizer.none(),
+        data_model_properties=Dict[str, int],
+    )
+
+    collection.data.insert_many([DataObject(properties={"data": i}) for i in range(25)])
+
+    ret: list[int] = [obj.properties["data"] for obj in collection.iterator(cache_size=cache_size)]
+    assert sorted(ret) == list(range(25))
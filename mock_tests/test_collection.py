@@ -1,6 +1,8 @@
 import json
 import time
-from typing import Any, Dict
+import uuid
+from concurrent import futures
+from typing import Any, Dict, List
 
 import grpc
 import pytest
@@ -24,9 +26,11 @@ from weaviate.collections.classes.config import (
     VectorIndexType,
     ShardingConfig,
 )
+from weaviate.config import ConnectionConfig
 from weaviate.connect.base import ConnectionParams, ProtocolParams
 from weaviate.connect.integrations import _IntegrationConfig
 from weaviate.exceptions import UnexpectedStatusCodeError, WeaviateStartUpError
+from weaviate.proto.v1 import search_get_pb2, weaviate_pb2_grpc
 
 ACCESS_TOKEN = "HELLO!IamAnAccessToken"
 REFRESH_TOKEN = "UseMeToRefreshYourAccessToken"
@@ -141,6 +145,191 @@ def test_closed_connection(weaviate_auth_mock: HTTPServer, start_grpc_server: gr
         collection.data.insert_many([{}])
 
 
+def test_grpc_channel_pool(weaviate_mock: HTTPServer, start_grpc_server: grpc.Server) -> None:
+    with weaviate.connect_to_local(
+        port=MOCK_PORT,
+        host=MOCK_IP,
+        grpc_port=MOCK_PORT_GRPC,
+        additional_config=wvc.init.AdditionalConfig(
+            connection=ConnectionConfig(grpc_channel_pool_size=2)
+        ),
+    ) as client:
+        first = client._connection.grpc_stub
+        second = client._connection.grpc_stub
+        assert first is not second
+        assert client._connection.grpc_stub is first
+
+
+class _PeerRecordingServicer(weaviate_pb2_grpc.WeaviateServicer):
+    def __init__(self) -> None:
+        self.peers: List[str] = []
+
+    def Search(
+        self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+    ) -> search_get_pb2.SearchReply:
+        self.peers.append(context.peer())
+        return search_get_pb2.SearchReply()
+
+
+def test_grpc_channel_pool_spreads_calls_over_connections(weaviate_mock: HTTPServer) -> None:
+    servicer = _PeerRecordingServicer()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(servicer, server)
+    port = server.add_insecure_port(f"{MOCK_IP}:0")
+    server.start()
+    try:
+        with weaviate.connect_to_local(
+            port=MOCK_PORT,
+            host=MOCK_IP,
+            grpc_port=port,
+            skip_init_checks=True,
+            additional_config=wvc.init.AdditionalConfig(
+                connection=ConnectionConfig(grpc_channel_pool_size=2)
+            ),
+        ) as client:
+            collection = client.collections.get("Test")
+            for _ in range(4):
+                collection.query.fetch_objects()
+    finally:
+        server.stop(0)
+
+    # every channel has its own connection, so the calls alternate between two client ports
+    assert len(servicer.peers) == 4
+    assert len(set(servicer.peers)) == 2
+    assert servicer.peers[0] == servicer.peers[2]
+    assert servicer.peers[1] == servicer.peers[3]
+
+
+class _MetadataRecordingServicer(weaviate_pb2_grpc.WeaviateServicer):
+    def __init__(self) -> None:
+        self.metadata: List[Dict[str, str]] = []
+
+    def Search(
+        self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+    ) -> search_get_pb2.SearchReply:
+        self.metadata.append(dict(context.invocation_metadata()))
+        return search_get_pb2.SearchReply()
+
+
+def test_grpc_headers_without_token_on_anonymous_weaviate(
+    weaviate_no_auth_mock: HTTPServer, recwarn: pytest.WarningsRecorder
+) -> None:
+    servicer = _MetadataRecordingServicer()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=1))
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(servicer, server)
+    port = server.add_insecure_port(f"{MOCK_IP}:0")
+    server.start()
+    try:
+        # OIDC credentials against a server without OIDC leave the client without a token
+        with weaviate.connect_to_local(
+            port=MOCK_PORT,
+            host=MOCK_IP,
+            grpc_port=port,
+            skip_init_checks=True,
+            headers={"X-Test": "value"},
+            auth_credentials=wvc.init.Auth.client_password("user", "password"),
+        ) as client:
+            client.collections.get("Test").query.fetch_objects()
+    finally:
+        server.stop(0)
+
+    assert len(servicer.metadata) == 1
+    assert servicer.metadata[0]["x-test"] == "value"
+    assert "authorization" not in servicer.metadata[0]
+
+
+class _FetchByIdsServicer(weaviate_pb2_grpc.WeaviateServicer):
+    def __init__(self, known: List[uuid.UUID]) -> None:
+        self.known = known
+        self.requests: List[search_get_pb2.SearchRequest] = []
+
+    def Search(
+        self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+    ) -> search_get_pb2.SearchReply:
+        self.requests.append(request)
+        wanted = set(request.filters.value_text_array.values)
+        # answer in the reverse of the stored order, the client has to restore the requested one
+        return search_get_pb2.SearchReply(
+            results=[
+                search_get_pb2.SearchResult(
+                    metadata=search_get_pb2.MetadataResult(
+                        id_as_bytes=known.bytes,
+                        creation_time_unix=1,
+                        creation_time_unix_present=True,
+                        last_update_time_unix=2,
+                        last_update_time_unix_present=True,
+                    ),
+                    properties=search_get_pb2.PropertiesResult(),
+                )
+                for known in reversed(self.known)
+                if str(known) in wanted
+            ]
+        )
+
+
+def test_fetch_objects_by_ids(weaviate_mock: HTTPServer) -> None:
+    first, second, missing = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    servicer = _FetchByIdsServicer([first, second])
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=1))
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(servicer, server)
+    port = server.add_insecure_port(f"{MOCK_IP}:0")
+    server.start()
+    try:
+        with weaviate.connect_to_local(
+            port=MOCK_PORT, host=MOCK_IP, grpc_port=port, skip_init_checks=True
+        ) as client:
+            collection = client.collections.get("Test")
+            objects = collection.query.fetch_objects_by_ids(
+                [second, str(missing), str(first).upper(), first]
+            )
+    finally:
+        server.stop(0)
+
+    # one round-trip for all ids, results in the requested order with None for the missing id
+    assert len(servicer.requests) == 1
+    assert servicer.requests[0].limit == 4
+    assert [obj.uuid if obj is not None else None for obj in objects] == [
+        second,
+        None,
+        first,
+        first,
+    ]
+    assert objects[0] is not None and objects[0].metadata.last_update_time is not None
+    assert objects[2] is not None and objects[3] is not None
+    assert objects[2].uuid == objects[3].uuid
+
+
+def test_grpc_channel_pool_is_disabled_by_default(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
+) -> None:
+    with weaviate.connect_to_local(
+        port=MOCK_PORT, host=MOCK_IP, grpc_port=MOCK_PORT_GRPC
+    ) as client:
+        assert len(client._connection._grpc_channels) == 1
+        assert client._connection.grpc_stub is client._connection.grpc_stub
+
+
+def test_collection_length_cache(weaviate_mock: HTTPServer, start_grpc_server: grpc.Server) -> None:
+    weaviate_mock.expect_request("/v1/graphql").respond_with_json(
+        {"data": {"Aggregate": {"Test": [{"meta": {"count": 5}}]}}}
+    )
+    with weaviate.connect_to_local(
+        port=MOCK_PORT,
+        host=MOCK_IP,
+        grpc_port=MOCK_PORT_GRPC,
+        additional_config=wvc.init.AdditionalConfig(
+            connection=ConnectionConfig(collection_length_cache_ttl=60)
+        ),
+    ) as client:
+        collection = client.collections.get("Test")
+        assert len(collection) == 5
+        assert len(collection) == 5
+        assert len(collection.with_tenant("tenant")) == 5
+
+    graphql_requests = [req for req, _ in weaviate_mock.log if req.path == "/v1/graphql"]
+    assert len(graphql_requests) == 2
+
+
 def test_missing_multi_tenancy_config(
     weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
 ) -> None:
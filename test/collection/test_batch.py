@@ -0,0 +1,31 @@
+from weaviate.collections.batch.base import ObjectsBatchRequest
+from weaviate.collections.classes.batch import _BatchObject
+
+
+def _batch_object(uuid: str) -> _BatchObject:
+    return _BatchObject(
+        collection="Test",
+        vector=None,
+        uuid=uuid,
+        properties=None,
+        tenant=None,
+        references=None,
+        retry_count=0,
+    )
+
+
+def test_objects_batch_request_pop_items() -> None:
+    request = ObjectsBatchRequest()
+    for i in range(5):
+        request.add(_batch_object(str(i)))
+
+    assert [obj.uuid for obj in request.pop_items(2)] == ["0", "1"]
+    assert len(request) == 3
+
+    request.prepend([_batch_object("retry")])
+    popped = request.pop_items(10)
+    assert [obj.uuid for obj in popped] == ["retry", "2", "3", "4"]
+    assert len(request) == 0
+
+    request.add(_batch_object("5"))
+    assert len(popped) == 4  # popped items are not affected by later additions
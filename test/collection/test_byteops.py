@@ -1,6 +1,13 @@
+import pytest
+
 from weaviate.collections.queries.byteops import _ByteOps
 
 
+def test_encode_float32s():
+    assert _ByteOps.encode_float32s([]) == b""
+    assert _ByteOps.encode_float32s([1.0, 2, 0.0]) == b"\x00\x00\x80?\x00\x00\x00@\x00\x00\x00\x00"
+
+
 def test_decode_float32s():
     assert _ByteOps.decode_float32s(b"") == []
     assert _ByteOps.decode_float32s(b"\x00\x00\x80?\x00\x00\x00@\x00\x00\x00\x00") == [
@@ -22,3 +29,20 @@ def test_decode_int64s():
     assert _ByteOps.decode_int64s(
         b"\x01\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00"
     ) == [1, 2]
+
+
+def test_encode_float32s_numpy():
+    np = pytest.importorskip("numpy")
+    vector = [1.0, 2.0, 0.0]
+    assert _ByteOps.encode_float32s(np.array(vector)) == _ByteOps.encode_float32s(vector)
+    assert _ByteOps.encode_float32s(np.array(vector, dtype=np.float32)) == (
+        b"\x00\x00\x80?\x00\x00\x00@\x00\x00\x00\x00"
+    )
+
+
+def test_encode_float32s_is_little_endian():
+    np = pytest.importorskip("numpy")
+    vector = [1.0, -2.5, 3.25]
+    expected = np.array(vector, dtype="<f4").tobytes()
+    assert _ByteOps.encode_float32s(vector) == expected
+    assert _ByteOps.encode_float32s(np.array(vector, dtype=">f8")) == expected
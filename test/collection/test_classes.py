@@ -1,7 +1,12 @@
+import uuid
+from typing import TypedDict
+
 import pytest
 from pydantic import ValidationError
 
 from weaviate.collections.classes.grpc import (
+    GroupBy,
+    QueryNested,
     QueryReference,
     _QueryReferenceMultiTarget,
     _QueryReference,
@@ -9,6 +14,14 @@ from weaviate.collections.classes.grpc import (
 )
 
 from weaviate.collections.classes.filters import Filter
+from weaviate.collections.classes.internal import (
+    Nested,
+    _Generative,
+    _GroupBy,
+    _QueryOptions,
+    _Reference,
+    _extract_properties_from_data_model,
+)
 
 
 def test_link_to_errors_on_extra_variable() -> None:
@@ -34,3 +47,57 @@ def test_direct_init_filter() -> None:
 def test_direct_init_sort() -> None:
     with pytest.raises(TypeError):
         Sort()
+
+
+def test_reference_to_beacons() -> None:
+    uid = uuid.uuid4()
+    assert _Reference(target_collection=None, uuids=uid)._to_beacons() == [
+        {"beacon": f"weaviate://localhost/{uid}"}
+    ]
+    assert _Reference(target_collection="Test", uuids=[uid, str(uid)])._to_beacons() == [
+        {"beacon": f"weaviate://localhost/Test/{uid}"},
+        {"beacon": f"weaviate://localhost/Test/{uid}"},
+    ]
+
+
+def test_link_to_hash_follows_mutation() -> None:
+    link_to = QueryReference(link_on="ref", return_properties=["name"])
+    before = hash(link_to)
+    assert isinstance(link_to.return_properties, list)
+    link_to.return_properties.append("age")
+    assert hash(link_to) != before
+    assert link_to not in {QueryReference(link_on="ref", return_properties=["name"])}
+
+
+def test_extract_properties_from_data_model_is_stable() -> None:
+    class Inner(TypedDict):
+        a: str
+
+    class Model(TypedDict):
+        name: str
+        inner: Nested[Inner]
+
+    expected = ["name", QueryNested(name="inner", properties=["a"])]
+    assert _extract_properties_from_data_model(Model) == expected
+    # the second call is served from the type hints cache and must not differ
+    assert _extract_properties_from_data_model(Model) == expected
+
+
+def test_generative_and_group_by_are_interned() -> None:
+    generative = _Generative.from_input(single="prompt", grouped=None, grouped_properties=["a"])
+    assert generative is _Generative.from_input(
+        single="prompt", grouped=None, grouped_properties=["a"]
+    )
+    assert generative.grouped_properties == ("a",)
+    assert list(generative.to_grpc().grouped_properties) == ["a"]
+
+    group_by = GroupBy(prop="a", number_of_groups=2, objects_per_group=3)
+    assert _GroupBy.from_input(group_by) is _GroupBy.from_input(group_by)
+    assert _GroupBy.from_input(None) is None
+
+
+def test_query_options_are_interned() -> None:
+    options = _QueryOptions.from_input(["creation_time"], None, True, None, None)
+    assert options is _QueryOptions.from_input(["distance"], ["name"], True, None, None)
+    assert options == _QueryOptions(True, True, False, True, False)
+    assert not _QueryOptions.from_input(None, [], ["vec"], None, None).include_properties
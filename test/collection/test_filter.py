@@ -4,7 +4,8 @@ import pytest
 
 import weaviate
 import weaviate.classes as wvc
-from weaviate.collections.classes.filters import _FilterAnd, _FilterOr
+from weaviate.collections.classes.filters import _FilterAnd, _FilterOr, _FilterValue
+from weaviate.collections.filters import _FilterToGRPC
 
 
 def test_empty_input_contains_any() -> None:
@@ -86,3 +87,35 @@ def test_filter_bitwise_or_assignment() -> None:
     assert isinstance(or_direct.filters[0], _FilterOr)
     assert f4.filters[0].filters == or_direct.filters[0].filters
     assert f4.filters[1] == f3
+
+
+def test_filter_value_to_grpc_is_reused() -> None:
+    f1 = wvc.query.Filter.by_property("test").equal("test")
+    f2 = wvc.query.Filter.by_property("test").contains_any([1, 2])
+
+    first = _FilterToGRPC.convert(f1 & f2)
+    assert _FilterToGRPC.convert(f1) is _FilterToGRPC.convert(f1)
+    assert _FilterToGRPC.convert(f1) is _FilterToGRPC.convert(
+        wvc.query.Filter.by_property("test").equal("test")
+    )
+    assert _FilterToGRPC.convert(f1 & f2) == first
+
+
+def test_filter_value_to_grpc_follows_mutation() -> None:
+    f1 = wvc.query.Filter.by_property("test").equal("test")
+    assert _FilterToGRPC.convert(f1).value_text == "test"
+    f1.value = "other"
+    assert _FilterToGRPC.convert(f1).value_text == "other"
+
+    f2 = wvc.query.Filter.by_property("test").contains_any([1, 2])
+    assert list(_FilterToGRPC.convert(f2).value_int_array.values) == [1, 2]
+    assert isinstance(f2, _FilterValue) and isinstance(f2.value, list)
+    f2.value.append(3)
+    assert list(_FilterToGRPC.convert(f2).value_int_array.values) == [1, 2, 3]
+
+
+def test_filter_value_to_grpc_keeps_int_and_float_apart() -> None:
+    as_int = _FilterToGRPC.convert(wvc.query.Filter.by_property("test").equal(1))
+    as_float = _FilterToGRPC.convert(wvc.query.Filter.by_property("test").equal(1.0))
+    assert as_int.HasField("value_int") and not as_int.HasField("value_number")
+    assert as_float.HasField("value_number") and not as_float.HasField("value_int")
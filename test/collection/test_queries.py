@@ -1,8 +1,12 @@
 import pytest
 from typing import Callable
+from weaviate.collections.collection import Collection
 from weaviate.connect import ConnectionV4
+from weaviate.collections.classes.grpc import Rerank
+from weaviate.collections.grpc.query import _QueryGRPC
 from weaviate.collections.query import _QueryCollection
 from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.proto.v1 import search_get_pb2
 
 # TODO: re-enable tests once string syntax is re-enabled in the API
 
@@ -99,6 +103,10 @@ def test_bad_query_inputs(connection: ConnectionV4) -> None:
     _test_query(lambda: query.fetch_objects(return_properties=42))
     _test_query(lambda: query.fetch_objects(return_references="wrong"))
 
+    # fetch_objects_by_ids
+    _test_query(lambda: query.fetch_objects_by_ids("2c4a6d3b-0f5e-4e8b-9a39-5f1e4a1c9c3d"))
+    _test_query(lambda: query.fetch_objects_by_ids(42))
+
     # bm25
     _test_query(lambda: query.bm25(42))
     _test_query(lambda: query.bm25("hi", query_properties="wrong"))
@@ -127,3 +135,46 @@ def test_bad_query_inputs(connection: ConnectionV4) -> None:
 
     # near image
     _test_query(lambda: query.near_image(42))
+
+
+def test_search_request_does_not_leak_between_queries(connection: ConnectionV4) -> None:
+    query = _QueryGRPC(connection, "Dummy", "tenant", None, True, True)
+    create_request = query._QueryGRPC__create_request  # type: ignore
+
+    first = create_request(limit=5, rerank=Rerank(prop="name"))
+    assert first.collection == "Dummy"
+    assert first.tenant == "tenant"
+    assert first.limit == 5
+    assert first.HasField("rerank")
+
+    second = create_request()
+    assert second == search_get_pb2.SearchRequest(
+        uses_123_api=True, uses_125_api=True, collection="Dummy", tenant="tenant"
+    )
+
+
+def test_collection_namespaces_are_built_on_first_access(connection: ConnectionV4) -> None:
+    collection = Collection(connection, "Dummy", True).with_tenant("tenant")
+    assert "query" not in vars(collection)
+
+    query = collection.query
+    assert collection.query is query
+    assert query._BaseQuery__tenant == "tenant"  # type: ignore
+    assert "data" not in vars(collection)
+
+    other = collection.with_tenant("other")
+    assert other.query is not query
+    assert other.query._BaseQuery__tenant == "other"  # type: ignore
+    assert collection.query._BaseQuery__tenant == "tenant"  # type: ignore
+
+
+def test_fetch_objects_by_ids_without_ids_skips_the_query(connection: ConnectionV4) -> None:
+    query = _QueryCollection(connection, "dummy", None, None, None, None, True)
+    assert query.fetch_objects_by_ids([]) == []
+
+
+def test_near_vector_rejects_malformed_numpy_arrays(connection: ConnectionV4) -> None:
+    np = pytest.importorskip("numpy")
+    query = _QueryGRPC(connection, "Dummy", None, None, False, True)
+    _test_query(lambda: query.near_vector(np.zeros((2, 2))))
+    _test_query(lambda: query.near_vector(np.array([1.0, "a"], dtype=object)))
@@ -1,3 +1,4 @@
+import base64
 import unittest
 import uuid as uuid_lib
 from copy import deepcopy
@@ -10,6 +11,7 @@ from weaviate.util import (
     generate_uuid5,
     image_decoder_b64,
     image_encoder_b64,
+    file_encoder_b64,
     generate_local_beacon,
     is_object_url,
     is_weaviate_object_url,
@@ -22,6 +24,7 @@ from weaviate.util import (
     is_weaviate_too_old,
     is_weaviate_client_too_old,
     MINIMUM_NO_WARNING_VERSION,
+    _LRUCache,
 )
 
 schema_set = {
@@ -575,3 +578,29 @@ def test_is_weaviate_too_old(version: str, too_old: bool):
 )
 def test_is_weaviate_client_too_old(current_version: str, latest_version: str, too_old: bool):
     assert is_weaviate_client_too_old(current_version, latest_version) is too_old
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache: _LRUCache[str, int] = _LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used entry
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("size", [0, 10, 3 * 65535 + 1])
+def test_file_encoder_b64_path_and_reader_agree(tmp_path, size: int):
+    content = bytes(range(256)) * (size // 256) + bytes(size % 256)
+    path = tmp_path / "file.bin"
+    path.write_bytes(content)
+    expected = base64.b64encode(content).decode("utf-8")
+    assert file_encoder_b64(path) == expected
+    assert file_encoder_b64(str(path)) == expected
+    with open(path, "rb") as file:
+        assert file_encoder_b64(file) == expected
@@ -5,7 +5,6 @@ import time
 import uuid as uuid_package
 from abc import ABC
 from collections import deque
-from copy import copy
 from dataclasses import dataclass, field
 from typing import (
     Any,
@@ -14,6 +13,7 @@ from typing import (
     List,
     Optional,
     Set,
+    Tuple,
     TypeVar,
     Union,
 )
@@ -118,11 +118,12 @@ class ObjectsBatchRequest(BatchRequest[_BatchObject, BatchObjectReturn]):
         """
         self._lock.acquire()
         if pop_amount >= len(self._items):
-            ret = copy(self._items)
-            self._items.clear()
+            # hand over the whole queue instead of copying it
+            ret = self._items
+            self._items = []
         else:
-            ret = copy(self._items[:pop_amount])
-            self._items = self._items[pop_amount:]
+            ret = self._items[:pop_amount]
+            del self._items[:pop_amount]
 
         self._lock.release()
         return ret
@@ -182,6 +183,7 @@ class _BatchBase:
         # we do not want that users can access the results directly as they are not thread-safe
         self.__results_for_wrapper_backup = results
         self.__results_for_wrapper = _BatchDataWrapper()
+        self.__imported_shard_keys: Set[Tuple[str, Optional[str]]] = set()
 
         self.__results_lock = threading.Lock()
 
@@ -645,9 +647,14 @@ class _BatchBase:
                 vector=vector,
                 tenant=tenant,
             )
-            self.__results_for_wrapper.imported_shards.add(
-                Shard(collection=collection, tenant=tenant)
-            )
+            # constructing and hashing a Shard model per object is costly, most batches only ever touch
+            # a few shards
+            shard_key = (collection, tenant)
+            if shard_key not in self.__imported_shard_keys:
+                self.__results_for_wrapper.imported_shards.add(
+                    Shard(collection=collection, tenant=tenant)
+                )
+                self.__imported_shard_keys.add(shard_key)
         except ValidationError as e:
             raise WeaviateBatchValidationError(repr(e))
         self.__uuid_lookup_lock.acquire()
@@ -75,14 +75,8 @@ class _BatchCollection(Generic[Properties], _BatchBase):
             `WeaviateBatchValidationError`
                 If the provided options are in the format required by Weaviate.
         """
-        return self._add_object(
-            collection=self.__name,
-            properties=properties,
-            references=references,
-            uuid=uuid,
-            vector=vector,
-            tenant=self.__tenant,
-        )
+        # called once per object, so the arguments are passed positionally
+        return self._add_object(self.__name, properties, references, uuid, vector, self.__tenant)
 
     def add_reference(
         self, from_uuid: UUID, from_property: str, to: Union[ReferenceInput, List[UUID]]
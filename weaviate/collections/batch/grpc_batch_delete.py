@@ -28,9 +28,10 @@ class _BatchDeleteGRPC(_BaseGRPC):
     ) -> Union[DeleteManyReturn[List[DeleteManyObject]], DeleteManyReturn[None]]:
         metadata = self._get_metadata()
         try:
-            assert self._connection.grpc_stub is not None
+            stub = self._connection.grpc_stub
+            assert stub is not None
             res: batch_delete_pb2.BatchDeleteReply
-            res, _ = self._connection.grpc_stub.BatchDelete.with_call(
+            res, _ = stub.BatchDelete.with_call(
                 batch_delete_pb2.BatchDeleteRequest(
                     collection=name,
                     consistency_level=self._consistency_level,
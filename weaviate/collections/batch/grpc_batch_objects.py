@@ -24,15 +24,17 @@ from weaviate.exceptions import (
     WeaviateInvalidInputError,
 )
 from weaviate.proto.v1 import batch_pb2, base_pb2
-from weaviate.util import _datetime_to_string, _get_vector_v4
+from weaviate.util import _datetime_to_string
+
+
+# vectors are already normalised to lists of floats when the batch objects are validated
+def _pack_vector(vector: List[float]) -> bytes:
+    return struct.pack("{}f".format(len(vector)), *vector)
 
 
 def _pack_named_vectors(vectors: Dict[str, List[float]]) -> List[base_pb2.Vectors]:
     return [
-        base_pb2.Vectors(
-            name=name,
-            vector_bytes=struct.pack("{}f".format(len(vector)), *vector),
-        )
+        base_pb2.Vectors(name=name, vector_bytes=_pack_vector(vector))
         for name, vector in vectors.items()
     ]
 
@@ -48,15 +50,11 @@ class _BatchGRPC(_BaseGRPC):
         super().__init__(connection, consistency_level)
 
     def __grpc_objects(self, objects: List[_BatchObject]) -> List[batch_pb2.BatchObject]:
-        def pack_vector(vector: Any) -> bytes:
-            vector_list = _get_vector_v4(vector)
-            return struct.pack("{}f".format(len(vector_list)), *vector_list)
-
         return [
             batch_pb2.BatchObject(
                 collection=obj.collection,
                 vector_bytes=(
-                    pack_vector(obj.vector)
+                    _pack_vector(obj.vector)
                     if obj.vector is not None and isinstance(obj.vector, list)
                     else None
                 ),
@@ -132,9 +130,10 @@ class _BatchGRPC(_BaseGRPC):
     def __send_batch(self, batch: List[batch_pb2.BatchObject], timeout: int) -> Dict[int, str]:
         metadata = self._get_metadata()
         try:
-            assert self._connection.grpc_stub is not None
+            stub = self._connection.grpc_stub
+            assert stub is not None
             res: batch_pb2.BatchObjectsReply
-            res, _ = self._connection.grpc_stub.BatchObjects.with_call(
+            res, _ = stub.BatchObjects.with_call(
                 batch_pb2.BatchObjectsRequest(
                     objects=batch,
                     consistency_level=self._consistency_level,
@@ -222,7 +221,8 @@ class _BatchGRPC(_BaseGRPC):
 
         multi_target: List[batch_pb2.BatchObject.MultiTargetRefProps] = []
         single_target: List[batch_pb2.BatchObject.SingleTargetRefProps] = []
-        non_ref_properties: Struct = Struct()
+        # primitives are collected first, filling the Struct in one update is cheaper than per key
+        non_ref_properties: Dict[str, Any] = {}
         bool_arrays: List[base_pb2.BooleanArrayProperties] = []
         text_arrays: List[base_pb2.TextArrayProperties] = []
         int_arrays: List[base_pb2.IntArrayProperties] = []
@@ -314,14 +314,16 @@ class _BatchGRPC(_BaseGRPC):
                     base_pb2.NumberArrayProperties(prop_name=key, values_bytes=values_bytes)
                 )
             elif isinstance(entry, GeoCoordinate):
-                non_ref_properties.update({key: entry._to_dict()})
+                non_ref_properties[key] = entry._to_dict()
             elif isinstance(entry, PhoneNumber):
-                non_ref_properties.update({key: entry._to_dict()})
+                non_ref_properties[key] = entry._to_dict()
             else:
-                non_ref_properties.update({key: _serialize_primitive(entry)})
+                non_ref_properties[key] = _serialize_primitive(entry)
 
+        non_ref_struct = Struct()
+        non_ref_struct.update(non_ref_properties)
         return batch_pb2.BatchObject.Properties(
-            non_ref_properties=non_ref_properties,
+            non_ref_properties=non_ref_struct,
             multi_target_ref_props=multi_target,
             single_target_ref_props=single_target,
             text_array_properties=text_arrays,
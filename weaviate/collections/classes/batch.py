@@ -10,19 +10,32 @@ from weaviate.types import BEACON, UUID, VECTORS
 from weaviate.util import _capitalize_first_letter, get_valid_uuid, _get_vector_v4
 
 
+# one of these is queued per inserted object, so they are slotted to keep batches small in memory
 @dataclass
 class _BatchObject:
+    __slots__ = (
+        "collection",
+        "vector",
+        "uuid",
+        "properties",
+        "tenant",
+        "references",
+        "retry_count",
+    )
+
     collection: str
     vector: Optional[VECTORS]
     uuid: str
     properties: Optional[Dict[str, WeaviateField]]
     tenant: Optional[str]
     references: Optional[ReferenceInputs]
-    retry_count: int = 0
+    retry_count: int
 
 
 @dataclass
 class _BatchReference:
+    __slots__ = ("from_", "to", "tenant", "from_uuid")
+
     from_: str
     to: str
     tenant: Optional[str]
@@ -67,6 +80,7 @@ class BatchObject(BaseModel):
             properties=self.properties,
             tenant=self.tenant,
             references=self.references,
+            retry_count=0,
         )
 
     @field_validator("collection")
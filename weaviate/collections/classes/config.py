@@ -1377,7 +1377,15 @@ class Property(_ConfigCreateModel):
         return v
 
     def _to_dict(self, vectorizer: Optional[Vectorizers] = None) -> Dict[str, Any]:
-        ret_dict = super()._to_dict()
+        # nested properties are serialised recursively below and the vectorization flags go into
+        # the moduleConfig, so keep pydantic from dumping them only for them to be thrown away
+        ret_dict = cast(
+            dict,
+            self.model_dump(
+                exclude_none=True,
+                exclude={"nestedProperties", "skip_vectorization", "vectorize_property_name"},
+            ),
+        )
         ret_dict["dataType"] = [ret_dict["dataType"]]
         if vectorizer is not None and vectorizer != Vectorizers.NONE:
             ret_dict["moduleConfig"] = {
@@ -1386,8 +1394,6 @@ class Property(_ConfigCreateModel):
                     "vectorizePropertyName": self.vectorize_property_name,
                 }
             }
-        del ret_dict["skip_vectorization"]
-        del ret_dict["vectorize_property_name"]
         if self.nestedProperties is not None:
             ret_dict["nestedProperties"] = (
                 [prop._to_dict() for prop in self.nestedProperties]
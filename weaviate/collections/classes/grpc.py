@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import ClassVar, List, Literal, Optional, Sequence, Type, Union
+from typing import ClassVar, List, Literal, Optional, Sequence, Tuple, Type, Union
 
 from pydantic import ConfigDict, Field
 
@@ -89,7 +89,8 @@ class MetadataQuery(_WeaviateInput):
         )
 
 
-@dataclass
+# frozen and hashable so that the gRPC request built from it can be memoized
+@dataclass(frozen=True)
 class _MetadataQuery:
     vector: bool
     uuid: bool = True
@@ -100,7 +101,7 @@ class _MetadataQuery:
     score: bool = False
     explain_score: bool = False
     is_consistent: bool = False
-    vectors: Optional[List[str]] = None
+    vectors: Optional[Tuple[str, ...]] = None
 
     @classmethod
     def from_public(
@@ -109,12 +110,12 @@ class _MetadataQuery:
         return (
             cls(
                 vector=include_vector if isinstance(include_vector, bool) else False,
-                vectors=include_vector if isinstance(include_vector, list) else None,
+                vectors=tuple(include_vector) if isinstance(include_vector, list) else None,
             )
             if public is None
             else cls(
                 vector=include_vector if isinstance(include_vector, bool) else False,
-                vectors=include_vector if isinstance(include_vector, list) else None,
+                vectors=tuple(include_vector) if isinstance(include_vector, list) else None,
                 creation_time_unix=public.creation_time,
                 last_update_time_unix=public.last_update_time,
                 distance=public.distance,
@@ -312,6 +313,8 @@ class _QueryReference(_WeaviateInput):
     return_references: Optional["REFERENCES"] = Field(default=None)
 
     def __hash__(self) -> int:  # for set
+        # derived from the current content on purpose, references are used as keys when memoizing
+        # request messages and may be mutated in place between queries
         return hash(str(self))
 
     @property
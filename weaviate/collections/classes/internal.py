@@ -1,6 +1,7 @@
 import datetime
 import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import (
     Any,
     Dict,
@@ -48,7 +49,7 @@ from weaviate.collections.classes.types import (
 )
 from weaviate.exceptions import WeaviateInvalidInputError
 from weaviate.util import _to_beacons
-from weaviate.types import INCLUDE_VECTOR, UUID, UUIDS
+from weaviate.types import BEACON, INCLUDE_VECTOR, UUID, UUIDS
 
 from weaviate.proto.v1 import search_get_pb2
 
@@ -197,20 +198,13 @@ class _RawGQLReturn:
     errors: Optional[Dict[str, Any]]
 
 
+@dataclass(frozen=True)
 class _Generative:
+    __slots__ = ("single", "grouped", "grouped_properties")
+
     single: Optional[str]
     grouped: Optional[str]
-    grouped_properties: Optional[List[str]]
-
-    def __init__(
-        self,
-        single: Optional[str],
-        grouped: Optional[str],
-        grouped_properties: Optional[List[str]],
-    ) -> None:
-        self.single = single
-        self.grouped = grouped
-        self.grouped_properties = grouped_properties
+    grouped_properties: Optional[Tuple[str, ...]]
 
     def to_grpc(self) -> search_get_pb2.GenerativeSearch:
         return search_get_pb2.GenerativeSearch(
@@ -219,17 +213,34 @@ class _Generative:
             grouped_properties=self.grouped_properties,
         )
 
+    @classmethod
+    def from_input(
+        cls,
+        single: Optional[str],
+        grouped: Optional[str],
+        grouped_properties: Optional[List[str]],
+    ) -> "_Generative":
+        return _Generative.__interned(
+            single, grouped, tuple(grouped_properties) if grouped_properties is not None else None
+        )
+
+    # the same prompts tend to be sent over and over, so reuse their instances
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def __interned(
+        single: Optional[str], grouped: Optional[str], grouped_properties: Optional[Tuple[str, ...]]
+    ) -> "_Generative":
+        return _Generative(single=single, grouped=grouped, grouped_properties=grouped_properties)
+
 
+@dataclass(frozen=True)
 class _GroupBy:
+    __slots__ = ("prop", "number_of_groups", "objects_per_group")
+
     prop: str
     number_of_groups: int
     objects_per_group: int
 
-    def __init__(self, prop: str, number_of_groups: int, objects_per_group: int) -> None:
-        self.prop = prop
-        self.number_of_groups = number_of_groups
-        self.objects_per_group = objects_per_group
-
     def to_grpc(self) -> search_get_pb2.GroupBy:
         return search_get_pb2.GroupBy(
             path=[self.prop],
@@ -240,19 +251,37 @@ class _GroupBy:
     @classmethod
     def from_input(cls, group_by: Optional[GroupBy]) -> Optional["_GroupBy"]:
         return (
-            cls(
-                prop=group_by.prop,
-                number_of_groups=group_by.number_of_groups,
-                objects_per_group=group_by.objects_per_group,
+            _GroupBy.__interned(
+                group_by.prop, group_by.number_of_groups, group_by.objects_per_group
             )
             if group_by
             else None
         )
 
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def __interned(prop: str, number_of_groups: int, objects_per_group: int) -> "_GroupBy":
+        return _GroupBy(
+            prop=prop, number_of_groups=number_of_groups, objects_per_group=objects_per_group
+        )
+
 
 Nested = Annotated[P, "NESTED"]
 
 
+# data models are resolved on every query but never change, do not mutate the cached results
+_TYPE_HINTS_CACHE: Dict[Any, Dict[str, Any]] = {}
+_DATA_MODEL_PROPERTIES_CACHE: Dict[Any, PROPERTIES] = {}
+_DATA_MODEL_REFERENCES_CACHE: Dict[Any, Optional[REFERENCES]] = {}
+
+
+def _get_type_hints(type_: Any) -> Dict[str, Any]:
+    hints = _TYPE_HINTS_CACHE.get(type_)
+    if hints is None:
+        hints = _TYPE_HINTS_CACHE[type_] = get_type_hints(type_, include_extras=True)
+    return hints
+
+
 def __is_nested(value: Any) -> bool:
     return (
         get_origin(value) is Annotated
@@ -267,7 +296,7 @@ def __create_nested_property_from_nested(name: str, value: Any) -> QueryNested:
         name=name,
         properties=[
             __create_nested_property_from_nested(key, val) if __is_nested(val) else key
-            for key, val in get_type_hints(inner_type, include_extras=True).items()
+            for key, val in _get_type_hints(inner_type).items()
         ],
     )
 
@@ -281,9 +310,18 @@ class _Reference:
         """You should not initialise this class directly. Use the `.to_multi()` class methods instead."""
         self.__target_collection = target_collection if target_collection else ""
         self.__uuids = uuids
+        self.__beacon_prefix = (
+            f"{BEACON}{self.__target_collection}/" if self.__target_collection else BEACON
+        )
 
     def _to_beacons(self) -> List[Dict[str, str]]:
-        return _to_beacons(self.__uuids, self.__target_collection)
+        uuids = (
+            [self.__uuids]
+            if isinstance(self.__uuids, uuid_package.UUID) or isinstance(self.__uuids, str)
+            else self.__uuids
+        )
+        prefix = self.__beacon_prefix
+        return [{"beacon": prefix + str(uuid)} for uuid in uuids]
 
     @property
     def is_one_to_many(self) -> bool:
@@ -465,10 +503,13 @@ def _extract_properties_from_data_model(type_: Type[Properties]) -> PROPERTIES:
     Checks to see if there is a _Reference[Properties], Annotated[_Reference[Properties]], or _Nested[Properties]
     in the data model and lists out the properties as classes readily consumable by the underlying API.
     """
-    return [
-        __create_nested_property_from_nested(key, value) if __is_nested(value) else key
-        for key, value in get_type_hints(type_, include_extras=True).items()
-    ]
+    properties = _DATA_MODEL_PROPERTIES_CACHE.get(type_)
+    if properties is None:
+        properties = _DATA_MODEL_PROPERTIES_CACHE[type_] = [
+            __create_nested_property_from_nested(key, value) if __is_nested(value) else key
+            for key, value in _get_type_hints(type_).items()
+        ]
+    return properties
 
 
 def _extract_references_from_data_model(type_: Type["References"]) -> Optional[REFERENCES]:
@@ -477,15 +518,18 @@ def _extract_references_from_data_model(type_: Type["References"]) -> Optional[R
     Checks to see if there is a _Reference[References], Annotated[_Reference[References]], or _Nested[References]
     in the data model and lists out the references as classes readily consumable by the underlying API.
     """
+    if type_ in _DATA_MODEL_REFERENCES_CACHE:
+        return _DATA_MODEL_REFERENCES_CACHE[type_]
     refs = [
         (
             __create_link_to_from_annotated_reference(key, value)
             if __is_annotated_reference(value)
             else __create_link_to_from_reference(key, value)
         )
-        for key, value in get_type_hints(type_, include_extras=True).items()
+        for key, value in _get_type_hints(type_).items()
     ]
-    return refs if len(refs) > 0 else None
+    _DATA_MODEL_REFERENCES_CACHE[type_] = refs if len(refs) > 0 else None
+    return _DATA_MODEL_REFERENCES_CACHE[type_]
 
 
 ReturnProperties: TypeAlias = Union[PROPERTIES, Type[TProperties]]
@@ -494,7 +538,7 @@ ReturnReferences: TypeAlias = Union[
 ]
 
 
-@dataclass
+@dataclass(frozen=True)
 class _QueryOptions:
     include_metadata: bool
     include_properties: bool
@@ -513,14 +557,30 @@ class _QueryOptions:
         rerank: Optional[Rerank] = None,
         group_by: Optional[GroupBy] = None,
     ) -> "_QueryOptions":
-        return cls(
-            include_metadata=return_metadata is not None or rerank is not None,
-            include_properties=not (
-                isinstance(return_properties, list) and len(return_properties) == 0
-            ),
-            include_references=collection_references is not None or query_references is not None,
-            include_vector=include_vector if isinstance(include_vector, bool) else True,
-            is_group_by=group_by is not None,
+        return _QueryOptions.__interned(
+            return_metadata is not None or rerank is not None,
+            not (isinstance(return_properties, list) and len(return_properties) == 0),
+            collection_references is not None or query_references is not None,
+            include_vector if isinstance(include_vector, bool) else True,
+            group_by is not None,
+        )
+
+    # there are only a handful of distinct option sets and every query resolves one, so share them
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __interned(
+        include_metadata: bool,
+        include_properties: bool,
+        include_references: bool,
+        include_vector: bool,
+        is_group_by: bool,
+    ) -> "_QueryOptions":
+        return _QueryOptions(
+            include_metadata=include_metadata,
+            include_properties=include_properties,
+            include_references=include_references,
+            include_vector=include_vector,
+            is_group_by=is_group_by,
         )
 
 
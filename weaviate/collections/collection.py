@@ -1,7 +1,9 @@
 import json
+import time
 import uuid as uuid_package
-from dataclasses import asdict
-from typing import Generic, Literal, Optional, Type, Union, overload
+from dataclasses import fields, is_dataclass
+from functools import cached_property
+from typing import Any, Dict, Generic, Literal, Optional, Tuple, Type, Union, overload
 
 from weaviate.collections.aggregate import _AggregateCollection
 from weaviate.collections.backups import _CollectionBackup
@@ -30,6 +32,14 @@ from weaviate.types import UUID
 from weaviate.validator import _validate_input, _ValidateArgument
 
 
+def _dataclass_to_json(obj: Any) -> Dict[str, Any]:
+    # Serialises the nested config dataclasses field by field while json.dumps walks the tree, producing the same
+    # output as dumping dataclasses.asdict() without first deep-copying every value into a new dict.
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {field.name: getattr(obj, field.name) for field in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class Collection(_CollectionBase, Generic[Properties, References]):
     """The collection class is the main entry point for interacting with a collection in Weaviate.
 
@@ -70,50 +80,82 @@ class Collection(_CollectionBase, Generic[Properties, References]):
     ) -> None:
         super().__init__(connection, name, validate_arguments)
 
-        self.aggregate = _AggregateCollection(
-            self._connection, self.name, consistency_level, tenant
-        )
+        self.__tenant = tenant
+        self.__consistency_level = consistency_level
+        self.__properties = properties
+        self.__references = references
+        self.__length_cache: Optional[Tuple[float, int]] = None
+
+    # The namespaces are built on first access so that `with_tenant` and `with_consistency_level` only pay
+    # for the ones that are actually used on the returned collection.
+    @cached_property
+    def aggregate(self) -> _AggregateCollection:
         """This namespace includes all the querying methods available to you when using Weaviate's standard aggregation capabilities."""
-        self.config = _ConfigCollection(self._connection, self.name, tenant)
-        """This namespace includes all the CRUD methods available to you when modifying the configuration of the collection in Weaviate."""
-        self.batch = _BatchCollectionWrapper[Properties](
-            connection, consistency_level, self.name, tenant, self.config
+        return _AggregateCollection(
+            self._connection, self.name, self.__consistency_level, self.__tenant
         )
+
+    @cached_property
+    def config(self) -> _ConfigCollection:
+        """This namespace includes all the CRUD methods available to you when modifying the configuration of the collection in Weaviate."""
+        return _ConfigCollection(self._connection, self.name, self.__tenant)
+
+    @cached_property
+    def batch(self) -> _BatchCollectionWrapper[Properties]:
         """This namespace contains all the functionality to upload data in batches to Weaviate for this specific collection."""
-        self.data = _DataCollection[Properties](
-            connection, self.name, consistency_level, tenant, validate_arguments, properties
+        return _BatchCollectionWrapper[Properties](
+            self._connection, self.__consistency_level, self.name, self.__tenant, self.config
         )
+
+    @cached_property
+    def data(self) -> _DataCollection[Properties]:
         """This namespace includes all the CUD methods available to you when modifying the data of the collection in Weaviate."""
-        self.generate = _GenerateCollection(
-            connection,
+        return _DataCollection[Properties](
+            self._connection,
             self.name,
-            consistency_level,
-            tenant,
-            properties,
-            references,
-            validate_arguments,
+            self.__consistency_level,
+            self.__tenant,
+            self._validate_arguments,
+            self.__properties,
         )
+
+    @cached_property
+    def generate(self) -> _GenerateCollection[Properties, References]:
         """This namespace includes all the querying methods available to you when using Weaviate's generative capabilities."""
-        self.query = _QueryCollection[Properties, References](
-            connection,
+        return _GenerateCollection(
+            self._connection,
             self.name,
-            consistency_level,
-            tenant,
-            properties,
-            references,
-            validate_arguments,
+            self.__consistency_level,
+            self.__tenant,
+            self.__properties,
+            self.__references,
+            self._validate_arguments,
         )
+
+    @cached_property
+    def query(self) -> _QueryCollection[Properties, References]:
         """This namespace includes all the querying methods available to you when using Weaviate's standard query capabilities."""
-        self.tenants = _Tenants(connection, self.name, consistency_level, validate_arguments)
+        return _QueryCollection[Properties, References](
+            self._connection,
+            self.name,
+            self.__consistency_level,
+            self.__tenant,
+            self.__properties,
+            self.__references,
+            self._validate_arguments,
+        )
+
+    @cached_property
+    def tenants(self) -> _Tenants:
         """This namespace includes all the CRUD methods available to you when modifying the tenants of a multi-tenancy-enabled collection in Weaviate."""
+        return _Tenants(
+            self._connection, self.name, self.__consistency_level, self._validate_arguments
+        )
 
-        self.backup = _CollectionBackup(connection, self.name)
+    @cached_property
+    def backup(self) -> _CollectionBackup:
         """This namespace includes all the backup methods available to you when backing up a collection in Weaviate."""
-
-        self.__tenant = tenant
-        self.__consistency_level = consistency_level
-        self.__properties = properties
-        self.__references = references
+        return _CollectionBackup(self._connection, self.name)
 
     def with_tenant(
         self, tenant: Optional[Union[str, Tenant]] = None
@@ -129,17 +171,13 @@ class Collection(_CollectionBase, Generic[Properties, References]):
             `tenant`
                 The tenant to use. Can be `str` or `wvc.tenants.Tenant`.
         """
-        _validate_input(
-            [_ValidateArgument(expected=[str, Tenant, None], name="tenant", value=tenant)]
-        )
-        return Collection[Properties, References](
-            self._connection,
-            self.name,
-            self._validate_arguments,
-            self.__consistency_level,
-            tenant.name if isinstance(tenant, Tenant) else tenant,
-            self.__properties,
-            self.__references,
+        # one tuple isinstance check on the common path, the generic validator only builds the error
+        if tenant is not None and not isinstance(tenant, (str, Tenant)):
+            _validate_input(
+                [_ValidateArgument(expected=[str, Tenant, None], name="tenant", value=tenant)]
+            )
+        return self.__clone_with(
+            tenant.name if isinstance(tenant, Tenant) else tenant, self.__consistency_level
         )
 
     def with_consistency_level(
@@ -156,7 +194,11 @@ class Collection(_CollectionBase, Generic[Properties, References]):
             `consistency_level`
                 The consistency level to use.
         """
-        if self._validate_arguments:
+        if (
+            self._validate_arguments
+            and consistency_level is not None
+            and not isinstance(consistency_level, ConsistencyLevel)
+        ):
             _validate_input(
                 [
                     _ValidateArgument(
@@ -166,24 +208,38 @@ class Collection(_CollectionBase, Generic[Properties, References]):
                     )
                 ]
             )
-        return Collection[Properties, References](
-            self._connection,
-            self.name,
-            self._validate_arguments,
-            consistency_level,
-            self.__tenant,
-            self.__properties,
-            self.__references,
-        )
+        return self.__clone_with(self.__tenant, consistency_level)
+
+    def __clone_with(
+        self, tenant: Optional[str], consistency_level: Optional[ConsistencyLevel]
+    ) -> "Collection[Properties, References]":
+        # Shallow copy of this collection without going through __init__. The namespaces and the cached length
+        # depend on the tenant and consistency level, so they are dropped and rebuilt lazily on the copy.
+        new = object.__new__(Collection)
+        state = self.__dict__.copy()
+        for key in _NAMESPACES.intersection(state):
+            del state[key]
+        new.__dict__ = state
+        new.__tenant = tenant
+        new.__consistency_level = consistency_level
+        new.__length_cache = None
+        return new
 
     def __len__(self) -> int:
+        ttl = self._connection._collection_length_cache_ttl
+        if ttl > 0:
+            cached = self.__length_cache
+            if cached is not None and time.monotonic() - cached[0] < ttl:
+                return cached[1]
         total = self.aggregate.over_all(total_count=True).total_count
         assert total is not None
+        if ttl > 0:
+            self.__length_cache = (time.monotonic(), total)
         return total
 
     def __str__(self) -> str:
         config = self.config.get()
-        json_ = json.dumps(asdict(config), indent=2)
+        json_ = json.dumps(config, indent=2, default=_dataclass_to_json)
         return f"<weaviate.Collection config={json_}>"
 
     @overload
@@ -195,6 +251,7 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None,
         after: Optional[UUID] = None,
+        cache_size: Optional[int] = None,
     ) -> _ObjectIterator[Properties, References]:
         ...
 
@@ -207,6 +264,7 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES,
         after: Optional[UUID] = None,
+        cache_size: Optional[int] = None,
     ) -> _ObjectIterator[Properties, CrossReferences]:
         ...
 
@@ -219,6 +277,7 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences],
         after: Optional[UUID] = None,
+        cache_size: Optional[int] = None,
     ) -> _ObjectIterator[Properties, TReferences]:
         ...
 
@@ -231,6 +290,7 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
         after: Optional[UUID] = None,
+        cache_size: Optional[int] = None,
     ) -> _ObjectIterator[TProperties, References]:
         ...
 
@@ -243,6 +303,7 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         return_properties: Type[TProperties],
         return_references: REFERENCES,
         after: Optional[UUID] = None,
+        cache_size: Optional[int] = None,
     ) -> _ObjectIterator[TProperties, CrossReferences]:
         ...
 
@@ -255,6 +316,7 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
         after: Optional[UUID] = None,
+        cache_size: Optional[int] = None,
     ) -> _ObjectIterator[TProperties, TReferences]:
         ...
 
@@ -267,6 +329,7 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
         after: Optional[UUID] = None,
+        cache_size: Optional[int] = None,
     ) -> Union[
         _ObjectIterator[Properties, References],
         _ObjectIterator[Properties, CrossReferences],
@@ -296,6 +359,9 @@ class Collection(_CollectionBase, Generic[Properties, References]):
                 The references to return with each object.
             `after`
                 The cursor to use to mark the initial starting point of the iterator in the collection.
+            `cache_size`
+                How many objects should be fetched per request to Weaviate. Larger values need fewer round-trips for big
+                collections at the cost of memory. Defaults to 100.
 
         Raises:
             `weaviate.exceptions.WeaviateGRPCQueryError`:
@@ -313,4 +379,10 @@ class Collection(_CollectionBase, Generic[Properties, References]):
             after
             if after is None or isinstance(after, uuid_package.UUID)
             else uuid_package.UUID(after),
+            cache_size,
         )
+
+
+_NAMESPACES = frozenset(
+    name for name, attr in vars(Collection).items() if isinstance(attr, cached_property)
+)
@@ -417,6 +417,7 @@ class _DataCollection(Generic[Properties], _Data):
                         properties=cast(dict, obj.properties),
                         tenant=self._tenant,
                         references=obj.references,
+                        retry_count=0,
                     )
                     if isinstance(obj, DataObject)
                     else _BatchObject(
@@ -426,6 +427,7 @@ class _DataCollection(Generic[Properties], _Data):
                         properties=cast(dict, obj),
                         tenant=self._tenant,
                         references=None,
+                        retry_count=0,
                     )
                 )
                 for obj in objects
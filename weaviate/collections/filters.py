@@ -1,5 +1,5 @@
 import uuid as uuid_lib
-from typing import Any, Dict, List, Literal, Optional, cast, overload
+from typing import Any, Dict, List, Literal, Optional, Tuple, cast, overload
 
 from weaviate.collections.classes.filters import (
     _CountRef,
@@ -16,7 +16,13 @@ from weaviate.collections.classes.filters import (
 from weaviate.exceptions import WeaviateInvalidInputError
 from weaviate.proto.v1 import base_pb2
 from weaviate.types import TIME
-from weaviate.util import _datetime_to_string
+from weaviate.util import _LRUCache, _datetime_to_string
+
+# The same filters are usually sent over and over. Only filters on a property with one immutable
+# value are cached, keyed by a snapshot of that value, so mutating a filter never serves a stale
+# message. The value's type is part of the key as 1 == 1.0 == True but each is sent differently.
+_CACHEABLE_FILTER_VALUES = (str, int, float, uuid_lib.UUID)
+_VALUE_FILTERS_CACHE: _LRUCache[Tuple[Any, ...], base_pb2.Filters] = _LRUCache(1024)
 
 
 class _FilterToGRPC:
@@ -35,7 +41,15 @@ class _FilterToGRPC:
         if weav_filter is None:
             return None
         elif isinstance(weav_filter, _FilterValue):
-            return _FilterToGRPC.__value_filter(weav_filter)
+            value, target = weav_filter.value, weav_filter.target
+            if not (isinstance(target, str) and isinstance(value, _CACHEABLE_FILTER_VALUES)):
+                return _FilterToGRPC.__value_filter(weav_filter)
+            # callers copy the returned message into their requests, so sharing it is safe
+            key = (weav_filter.operator, target, type(value), value)
+            if (cached := _VALUE_FILTERS_CACHE.get(key)) is None:
+                cached = _FilterToGRPC.__value_filter(weav_filter)
+                _VALUE_FILTERS_CACHE.put(key, cached)
+            return cached
         else:
             return _FilterToGRPC.__and_or_filter(weav_filter)
 
@@ -1,6 +1,19 @@
 from dataclasses import dataclass
-import struct
-from typing import Any, Dict, List, Literal, Optional, Sequence, Set, TypeVar, Union, cast, Tuple
+from functools import lru_cache
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    cast,
+    Tuple,
+)
 
 from typing_extensions import TypeAlias
 
@@ -29,11 +42,16 @@ from weaviate.collections.classes.grpc import (
 )
 from weaviate.collections.classes.internal import _Generative, _GroupBy
 from weaviate.collections.filters import _FilterToGRPC
+from weaviate.collections.queries.byteops import _ByteOps
 
 from weaviate.collections.grpc.shared import _BaseGRPC
 
 from weaviate.connect import ConnectionV4
-from weaviate.exceptions import WeaviateQueryError, WeaviateUnsupportedFeatureError
+from weaviate.exceptions import (
+    WeaviateInvalidInputError,
+    WeaviateQueryError,
+    WeaviateUnsupportedFeatureError,
+)
 from weaviate.types import NUMBER, UUID
 from weaviate.util import _get_vector_v4
 
@@ -83,6 +101,14 @@ class _QueryGRPC(_BaseGRPC):
         self._tenant = tenant
         self._validate_arguments = validate_arguments
         self.__uses_125_api = uses_125_api
+        # the fields that are the same for every query of this collection, copied into each request
+        self.__request_prototype = search_get_pb2.SearchRequest(
+            uses_123_api=True,
+            uses_125_api=uses_125_api,
+            collection=name,
+            consistency_level=self._consistency_level,
+            tenant=tenant,
+        )
 
     def __parse_near_options(
         self,
@@ -200,7 +226,7 @@ class _QueryGRPC(_BaseGRPC):
                 ),
                 target_vectors=[target_vector] if target_vector is not None else None,
                 vector_bytes=(
-                    struct.pack("{}f".format(len(vector)), *vector)
+                    _ByteOps.encode_float32s(vector)
                     if vector is not None and isinstance(vector, list)
                     else None
                 ),
@@ -217,7 +243,7 @@ class _QueryGRPC(_BaseGRPC):
                 ),
                 near_vector=(
                     search_get_pb2.NearVector(
-                        vector_bytes=struct.pack("{}f".format(len(vector.vector)), *vector.vector),
+                        vector_bytes=_ByteOps.encode_float32s(vector.vector),
                         certainty=vector.certainty,
                         distance=vector.distance,
                     )
@@ -314,7 +340,16 @@ class _QueryGRPC(_BaseGRPC):
                 ]
             )
 
-        near_vector = _get_vector_v4(near_vector)
+        # numpy arrays skip the round-trip through a python list and are encoded directly, so they
+        # are checked here for what _get_vector_v4 would otherwise have rejected
+        if hasattr(near_vector, "astype") and hasattr(near_vector, "tobytes"):
+            kind = getattr(getattr(near_vector, "dtype", None), "kind", None)
+            if getattr(near_vector, "ndim", None) != 1 or kind not in ("f", "i", "u"):
+                raise WeaviateInvalidInputError(
+                    f"The vector you supplied was malformatted! Vector:  {near_vector}"
+                )
+        else:
+            near_vector = _get_vector_v4(near_vector)
         certainty, distance = self.__parse_near_options(certainty, distance)
 
         request = self.__create_request(
@@ -331,7 +366,7 @@ class _QueryGRPC(_BaseGRPC):
             near_vector=search_get_pb2.NearVector(
                 certainty=certainty,
                 distance=distance,
-                vector_bytes=struct.pack("{}f".format(len(near_vector)), *near_vector),
+                vector_bytes=_ByteOps.encode_float32s(near_vector),
                 target_vectors=[target_vector] if target_vector is not None else None,
             ),
         )
@@ -384,7 +419,7 @@ class _QueryGRPC(_BaseGRPC):
             ),
         )
 
-        return self.__call(base_request)
+        return self.__call_cached(base_request)
 
     def near_text(
         self,
@@ -516,7 +551,7 @@ class _QueryGRPC(_BaseGRPC):
             group_by=group_by,
             **kwargs,
         )
-        return self.__call(request)
+        return self.__call_cached(request)
 
     @staticmethod
     def __parse_move(move: Optional[Move]) -> Optional[search_get_pb2.NearTextSearch.Move]:
@@ -593,60 +628,92 @@ class _QueryGRPC(_BaseGRPC):
                     )
 
         if return_references is not None:
-            return_references_parsed: Optional[Set[REFERENCE]] = self.__convert_to_set(
+            return_references_parsed: Optional[FrozenSet[REFERENCE]] = self.__convert_to_set(
                 return_references
             )
         else:
             return_references_parsed = None
 
         if return_properties is not None:
-            return_properties_parsed: Optional[Set[PROPERTY]] = self.__convert_to_set(
+            return_properties_parsed: Optional[FrozenSet[PROPERTY]] = self.__convert_to_set(
                 return_properties
             )
         else:
             return_properties_parsed = None
 
-        return search_get_pb2.SearchRequest(
-            uses_123_api=True,
-            uses_125_api=self.__uses_125_api,
-            collection=self._name,
-            limit=limit,
-            offset=offset,
-            after=str(after) if after is not None else "",
-            autocut=autocut,
-            properties=self._translate_properties_from_python_to_grpc(
-                return_properties_parsed, return_references_parsed
-            ),
-            metadata=(self._metadata_to_grpc(metadata) if metadata is not None else None),
-            consistency_level=self._consistency_level,
-            tenant=self._tenant,
-            filters=_FilterToGRPC.convert(filters),
-            generative=generative.to_grpc() if generative is not None else None,
-            group_by=group_by.to_grpc() if group_by is not None else None,
-            rerank=(
-                search_get_pb2.Rerank(property=rerank.prop, query=rerank.query)
-                if rerank is not None
-                else None
-            ),
-            near_vector=near_vector,
-            sort_by=sort_by,
-            hybrid_search=hybrid_search,
-            bm25_search=bm25,
-            near_object=near_object,
-            near_text=near_text,
-            near_audio=near_audio,
-            near_depth=near_depth,
-            near_image=near_image,
-            near_imu=near_imu,
-            near_thermal=near_thermal,
-            near_video=near_video,
+        # Only what is set for this query is written into a copy of the prototype, instead of passing all
+        # fields as keyword arguments and letting protobuf sort out the unset ones on every call.
+        request = search_get_pb2.SearchRequest()
+        request.CopyFrom(self.__request_prototype)
+        if limit is not None:
+            request.limit = limit
+        if offset is not None:
+            request.offset = offset
+        if after is not None:
+            request.after = str(after)
+        if autocut is not None:
+            request.autocut = autocut
+        properties = self.__translate_properties_cached(
+            return_properties_parsed, return_references_parsed
         )
+        if properties is not None:
+            request.properties.CopyFrom(properties)
+        if metadata is not None:
+            request.metadata.CopyFrom(self._metadata_to_grpc(metadata))
+        filters_grpc = _FilterToGRPC.convert(filters)
+        if filters_grpc is not None:
+            request.filters.CopyFrom(filters_grpc)
+        if generative is not None:
+            request.generative.CopyFrom(self.__generative_to_grpc(generative))
+        if group_by is not None:
+            request.group_by.CopyFrom(self.__group_by_to_grpc(group_by))
+        if rerank is not None:
+            request.rerank.CopyFrom(search_get_pb2.Rerank(property=rerank.prop, query=rerank.query))
+        if sort_by is not None:
+            request.sort_by.extend(sort_by)
+        # the search modes are mutually exclusive, stop at the one that is set
+        if near_vector is not None:
+            request.near_vector.CopyFrom(near_vector)
+        elif hybrid_search is not None:
+            request.hybrid_search.CopyFrom(hybrid_search)
+        elif bm25 is not None:
+            request.bm25_search.CopyFrom(bm25)
+        elif near_text is not None:
+            request.near_text.CopyFrom(near_text)
+        elif near_object is not None:
+            request.near_object.CopyFrom(near_object)
+        elif near_image is not None:
+            request.near_image.CopyFrom(near_image)
+        elif near_audio is not None:
+            request.near_audio.CopyFrom(near_audio)
+        elif near_video is not None:
+            request.near_video.CopyFrom(near_video)
+        elif near_depth is not None:
+            request.near_depth.CopyFrom(near_depth)
+        elif near_thermal is not None:
+            request.near_thermal.CopyFrom(near_thermal)
+        elif near_imu is not None:
+            request.near_imu.CopyFrom(near_imu)
+        return request
+
+    def __call_cached(self, request: search_get_pb2.SearchRequest) -> search_get_pb2.SearchReply:
+        cache = self._connection._search_cache
+        if cache is None:
+            return self.__call(request)
+        # the serialized request covers every parameter, including collection, tenant and media
+        key = request.SerializeToString(deterministic=True)
+        res = cache.get(key)
+        if res is None:
+            res = self.__call(request)
+            cache.put(key, res)
+        return res
 
     def __call(self, request: search_get_pb2.SearchRequest) -> search_get_pb2.SearchReply:
         try:
-            assert self._connection.grpc_stub is not None
+            stub = self._connection.grpc_stub
+            assert stub is not None
             res: search_get_pb2.SearchReply  # According to PEP-0526
-            res, _ = self._connection.grpc_stub.Search.with_call(
+            res, _ = stub.Search.with_call(
                 request,
                 metadata=self._connection.grpc_headers(),
                 timeout=self._connection.timeout_config.query,
@@ -657,7 +724,10 @@ class _QueryGRPC(_BaseGRPC):
         except grpc.RpcError as e:
             raise WeaviateQueryError(e.details(), "GRPC search")  # pyright: ignore
 
-    def _metadata_to_grpc(self, metadata: _MetadataQuery) -> search_get_pb2.MetadataRequest:
+    # the same metadata selection is requested over and over, build its message only once
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _metadata_to_grpc(metadata: _MetadataQuery) -> search_get_pb2.MetadataRequest:
         return search_get_pb2.MetadataRequest(
             uuid=metadata.uuid,
             vector=metadata.vector,
@@ -671,48 +741,79 @@ class _QueryGRPC(_BaseGRPC):
             vectors=metadata.vectors,
         )
 
-    def __resolve_property(self, prop: QueryNested) -> search_get_pb2.ObjectPropertiesRequest:
+    # interned by their from_input constructors, so repeated prompts and groupings hit these caches
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def __generative_to_grpc(generative: _Generative) -> search_get_pb2.GenerativeSearch:
+        return generative.to_grpc()
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def __group_by_to_grpc(group_by: _GroupBy) -> search_get_pb2.GroupBy:
+        return group_by.to_grpc()
+
+    @staticmethod
+    def __resolve_property(prop: QueryNested) -> search_get_pb2.ObjectPropertiesRequest:
         props = prop.properties if isinstance(prop.properties, list) else [prop.properties]
         return search_get_pb2.ObjectPropertiesRequest(
             prop_name=prop.name,
             primitive_properties=[p for p in props if isinstance(p, str)],
             object_properties=[
-                self.__resolve_property(p) for p in props if isinstance(p, QueryNested)
+                _QueryGRPC.__resolve_property(p) for p in props if isinstance(p, QueryNested)
             ],
         )
 
+    # Applications tend to send the same return properties/references over and over, so the built
+    # request is memoized. Sharing it is safe as protobuf copies sub-messages passed to constructors.
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def __translate_properties_cached(
+        properties: Optional[FrozenSet[PROPERTY]], references: Optional[FrozenSet[REFERENCE]]
+    ) -> Optional[search_get_pb2.PropertiesRequest]:
+        return _QueryGRPC._translate_properties_from_python_to_grpc(properties, references)
+
+    @staticmethod
     def _translate_properties_from_python_to_grpc(
-        self, properties: Optional[Set[PROPERTY]], references: Optional[Set[REFERENCE]]
+        properties: Optional[Collection[PROPERTY]], references: Optional[Collection[REFERENCE]]
     ) -> Optional[search_get_pb2.PropertiesRequest]:
         if properties is None and references is None:
             return None
+
+        # partition in a single pass, only the top level is deduplicated by the caller
+        non_ref_properties: Optional[List[str]] = None
+        object_properties: Optional[List[search_get_pb2.ObjectPropertiesRequest]] = None
+        if properties is not None:
+            non_ref_properties = []
+            object_properties = []
+            for prop in properties:
+                if isinstance(prop, str):
+                    non_ref_properties.append(prop)
+                elif isinstance(prop, QueryNested):
+                    object_properties.append(_QueryGRPC.__resolve_property(prop))
+
         return search_get_pb2.PropertiesRequest(
             return_all_nonref_properties=properties is None,
-            non_ref_properties=(
-                None
-                if properties is None
-                else [prop for prop in properties if isinstance(prop, str)]
-            ),
+            non_ref_properties=non_ref_properties,
             ref_properties=(
                 None
                 if references is None
                 else [
                     search_get_pb2.RefPropertiesRequest(
                         reference_property=ref.link_on,
-                        properties=self._translate_properties_from_python_to_grpc(
+                        properties=_QueryGRPC._translate_properties_from_python_to_grpc(
                             (
                                 None
                                 if ref.return_properties is None
-                                else self.__convert_to_set(ref.return_properties)
+                                else _QueryGRPC.__as_sequence(ref.return_properties)
                             ),
                             (
                                 None
                                 if ref.return_references is None
-                                else self.__convert_to_set(ref.return_references)
+                                else _QueryGRPC.__as_sequence(ref.return_references)
                             ),
                         ),
                         metadata=(
-                            self._metadata_to_grpc(ref._return_metadata)
+                            _QueryGRPC._metadata_to_grpc(ref._return_metadata)
                             if ref._return_metadata is not None
                             else None
                         ),
@@ -725,20 +826,16 @@ class _QueryGRPC(_BaseGRPC):
                     for ref in references
                 ]
             ),
-            object_properties=(
-                None
-                if properties is None
-                else [
-                    self.__resolve_property(prop)
-                    for prop in properties
-                    if isinstance(prop, QueryNested)
-                ]
-            ),
+            object_properties=object_properties,
         )
 
     @staticmethod
-    def __convert_to_set(args: Union[A, Sequence[A]]) -> Set[A]:
+    def __as_sequence(args: Union[A, Sequence[A]]) -> Sequence[A]:
+        return args if isinstance(args, list) else (cast(A, args),)
+
+    @staticmethod
+    def __convert_to_set(args: Union[A, Sequence[A]]) -> FrozenSet[A]:
         if isinstance(args, list):
-            return set(args)
+            return frozenset(args)
         else:
-            return {cast(A, args)}
+            return frozenset((cast(A, args),))
@@ -1,4 +1,4 @@
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple
 
 from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.connect import ConnectionV4
@@ -15,22 +15,7 @@ class _BaseGRPC:
         self._consistency_level = self._get_consistency_level(consistency_level)
 
     def _get_metadata(self) -> Optional[Tuple[Tuple[str, str], ...]]:
-        metadata: Optional[Tuple[Tuple[str, str], ...]] = None
-        access_token = self._connection.get_current_bearer_token()
-
-        metadata_list: List[Tuple[str, str]] = []
-        if len(access_token) > 0:
-            metadata_list.append(("authorization", access_token))
-
-        if len(self._connection.additional_headers):
-            for key, val in self._connection.additional_headers.items():
-                if val is not None:
-                    metadata_list.append((key.lower(), val))
-
-        if len(metadata_list) > 0:
-            metadata = tuple(metadata_list)
-
-        return metadata
+        return self._connection.grpc_headers()
 
     @staticmethod
     def _get_consistency_level(
@@ -20,14 +20,15 @@ class _TenantsGRPC(_BaseGRPC):
         self._name: str = name
 
     def get(self, names: Optional[Sequence[str]]) -> tenants_pb2.TenantsGetReply:
-        assert self._connection.grpc_stub is not None, "gRPC stub is not initialized"
+        stub = self._connection.grpc_stub
+        assert stub is not None, "gRPC stub is not initialized"
 
         request = tenants_pb2.TenantsGetRequest(
             collection=self._name,
             names=tenants_pb2.TenantNames(values=names) if names is not None else None,
         )
         res: tenants_pb2.TenantsGetReply  # According to PEP-0526
-        res, _ = self._connection.grpc_stub.TenantsGet.with_call(
+        res, _ = stub.TenantsGet.with_call(
             request,
             metadata=self._connection.grpc_headers(),
             timeout=self._connection.timeout_config.query,
@@ -1,4 +1,5 @@
-from typing import Callable, Generic, Iterable, Iterator, List, Optional
+from collections import deque
+from typing import Callable, Deque, Generic, Iterable, Iterator, List, Optional
 from uuid import UUID
 
 from weaviate.collections.classes.internal import Object
@@ -13,29 +14,31 @@ class _ObjectIterator(Generic[P, R], Iterable[Object[P, R]]):
         self,
         fetch_objects_query: Callable[[int, Optional[UUID]], List[Object[P, R]]],
         init_after: Optional[UUID],
+        cache_size: Optional[int] = None,
     ) -> None:
         self.__query = fetch_objects_query
         self.__init_after = init_after
+        self.__cache_size = ITERATOR_CACHE_SIZE if cache_size is None else cache_size
 
-        self.__iter_object_cache: List[Object[P, R]] = []
+        self.__iter_object_cache: Deque[Object[P, R]] = deque()
         self.__iter_object_last_uuid: Optional[UUID] = init_after
 
     def __iter__(self) -> Iterator[Object[P, R]]:
-        self.__iter_object_cache = []
+        self.__iter_object_cache = deque()
         self.__iter_object_last_uuid = self.__init_after
         return self
 
     def __next__(self) -> Object[P, R]:
         if len(self.__iter_object_cache) == 0:
             objects = self.__query(
-                ITERATOR_CACHE_SIZE,
+                self.__cache_size,
                 self.__iter_object_last_uuid,
             )
-            self.__iter_object_cache = objects
+            self.__iter_object_cache = deque(objects)
             if len(self.__iter_object_cache) == 0:
                 raise StopIteration
 
-        ret_object = self.__iter_object_cache.pop(0)
+        ret_object = self.__iter_object_cache.popleft()
         self.__iter_object_last_uuid = ret_object.uuid
         assert (
             self.__iter_object_last_uuid is not None
@@ -3,7 +3,20 @@ import io
 import os
 import pathlib
 import uuid as uuid_lib
-from typing import Any, Dict, Generic, List, Optional, Sequence, Type, Union, cast
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+    cast,
+)
 
 from typing_extensions import is_typeddict
 
@@ -63,6 +76,48 @@ from weaviate.warnings import _Warnings
 from weaviate.types import INCLUDE_VECTOR
 
 
+# cross-referenced objects are always returned in full, share the options between all of them
+_REF_QUERY_OPTIONS = _QueryOptions(True, True, True, True, False)
+
+
+# Decoders for the value kinds that do not recurse, looked up by the name of the set oneof field.
+# Nested lists and objects need the query's state and are handled by the _BaseQuery methods.
+_VALUE_DECODERS: Dict[str, Callable[[properties_pb2.Value], Any]] = {
+    "text_value": lambda value: str(value.text_value),
+    "int_value": lambda value: int(value.int_value),
+    "number_value": lambda value: float(value.number_value),
+    "bool_value": lambda value: bool(value.bool_value),
+    "uuid_value": lambda value: uuid_lib.UUID(value.uuid_value),
+    "date_value": lambda value: _datetime_from_weaviate_str(value.date_value),
+    "string_value": lambda value: str(value.string_value),
+    "geo_value": lambda value: GeoCoordinate(
+        latitude=value.geo_value.latitude, longitude=value.geo_value.longitude
+    ),
+    "blob_value": lambda value: value.blob_value,
+    "phone_value": lambda value: _PhoneNumber(
+        country_code=value.phone_value.country_code,
+        default_country=value.phone_value.default_country,
+        international_formatted=value.phone_value.international_formatted,
+        national=value.phone_value.national,
+        national_formatted=value.phone_value.national_formatted,
+        number=value.phone_value.input,
+        valid=value.phone_value.valid,
+    ),
+    "null_value": lambda value: None,
+}
+
+_LIST_VALUE_DECODERS: Dict[str, Callable[[properties_pb2.ListValue], List[Any]]] = {
+    "text_values": lambda value: list(value.text_values.values),
+    "int_values": lambda value: _ByteOps.decode_int64s(value.int_values.values),
+    "number_values": lambda value: _ByteOps.decode_float64s(value.number_values.values),
+    "bool_values": lambda value: list(value.bool_values.values),
+    "uuid_values": lambda value: [uuid_lib.UUID(val) for val in value.uuid_values.values],
+    "date_values": lambda value: [
+        _datetime_from_weaviate_str(val) for val in value.date_values.values
+    ],
+}
+
+
 class _WeaviateUUIDInt(uuid_lib.UUID):
     def __init__(self, hex_: int) -> None:
         object.__setattr__(self, "int", hex_)
@@ -102,7 +157,8 @@ class _BaseQuery(Generic[Properties, References]):
         timestamp: int,
     ) -> datetime.datetime:
         # Handle the case in which last_update_time_unix is in nanoseconds or milliseconds, issue #958
-        if len(str(timestamp)) <= 13:
+        # Millisecond timestamps have at most 13 digits, compare numerically to avoid formatting the int
+        if timestamp < 10**13:
             return datetime.datetime.fromtimestamp(timestamp / 1000, tz=datetime.timezone.utc)
         else:
             return datetime.datetime.fromtimestamp(timestamp / 1e9, tz=datetime.timezone.utc)
@@ -150,20 +206,12 @@ class _BaseQuery(Generic[Properties, References]):
         self,
         add_props: "search_get_pb2.MetadataResult",
     ) -> Dict[str, List[float]]:
-        if (
-            len(add_props.vector_bytes) == 0
-            and len(add_props.vector) == 0
-            and len(add_props.vectors) == 0
-        ):
-            return {}
-
         if len(add_props.vector_bytes) > 0:
             return {"default": _ByteOps.decode_float32s(add_props.vector_bytes)}
 
-        vecs = {}
-        for vec in add_props.vectors:
-            vecs[vec.name] = _ByteOps.decode_float32s(vec.vector_bytes)
-        return vecs
+        # the legacy float list in `vector` is ignored, named vectors always arrive as bytes
+        decode = _ByteOps.decode_float32s
+        return {vec.name: decode(vec.vector_bytes) for vec in add_props.vectors}
 
     def __extract_generated_for_object(
         self,
@@ -174,81 +222,45 @@ class _BaseQuery(Generic[Properties, References]):
     def __deserialize_list_value_prop_125(
         self, value: properties_pb2.ListValue
     ) -> Optional[List[Any]]:
-        if value.HasField("bool_values"):
-            return list(value.bool_values.values)
-        if value.HasField("date_values"):
-            return [_datetime_from_weaviate_str(val) for val in value.date_values.values]
-        if value.HasField("int_values"):
-            return _ByteOps.decode_int64s(value.int_values.values)
-        if value.HasField("number_values"):
-            return _ByteOps.decode_float64s(value.number_values.values)
-        if value.HasField("text_values"):
-            return list(value.text_values.values)
-        if value.HasField("uuid_values"):
-            return [uuid_lib.UUID(val) for val in value.uuid_values.values]
-        if value.HasField("object_values"):
-            return [
-                self.__parse_nonref_properties_result(val) for val in value.object_values.values
-            ]
-        _Warnings.unknown_type_encountered(value.WhichOneof("Value"))
+        kind = value.WhichOneof("kind")
+        decoder = _LIST_VALUE_DECODERS.get(kind)
+        if decoder is not None:
+            return decoder(value)
+        if kind == "object_values":
+            parse = self.__parse_nonref_properties_result
+            return [parse(val) for val in value.object_values.values]
+        _Warnings.unknown_type_encountered(kind)
         return None
 
     def __deserialize_list_value_prop_123(self, value: properties_pb2.ListValue) -> List[Any]:
-        return [self.__deserialize_non_ref_prop(val) for val in value.values]
+        deserialize = self.__deserialize_non_ref_prop
+        return [deserialize(val) for val in value.values]
 
     def __deserialize_non_ref_prop(self, value: properties_pb2.Value) -> Any:
-        if value.HasField("uuid_value"):
-            return uuid_lib.UUID(value.uuid_value)
-        if value.HasField("date_value"):
-            return _datetime_from_weaviate_str(value.date_value)
-        if value.HasField("string_value"):
-            return str(value.string_value)
-        if value.HasField("text_value"):
-            return str(value.text_value)
-        if value.HasField("int_value"):
-            return int(value.int_value)
-        if value.HasField("number_value"):
-            return float(value.number_value)
-        if value.HasField("bool_value"):
-            return bool(value.bool_value)
-        if value.HasField("list_value"):
+        # a single oneof lookup instead of probing every field with HasField
+        kind = value.WhichOneof("kind")
+        decoder = _VALUE_DECODERS.get(kind)
+        if decoder is not None:
+            return decoder(value)
+        if kind == "list_value":
             return (
                 self.__deserialize_list_value_prop_125(value.list_value)
                 if self.__uses_125_api
                 else self.__deserialize_list_value_prop_123(value.list_value)
             )
-        if value.HasField("object_value"):
+        if kind == "object_value":
             return self.__parse_nonref_properties_result(value.object_value)
-        if value.HasField("geo_value"):
-            return GeoCoordinate(
-                latitude=value.geo_value.latitude, longitude=value.geo_value.longitude
-            )
-        if value.HasField("blob_value"):
-            return value.blob_value
-        if value.HasField("phone_value"):
-            return _PhoneNumber(
-                country_code=value.phone_value.country_code,
-                default_country=value.phone_value.default_country,
-                international_formatted=value.phone_value.international_formatted,
-                national=value.phone_value.national,
-                national_formatted=value.phone_value.national_formatted,
-                number=value.phone_value.input,
-                valid=value.phone_value.valid,
-            )
-        if value.HasField("null_value"):
-            return None
 
-        _Warnings.unknown_type_encountered(value.WhichOneof("Value"))
+        _Warnings.unknown_type_encountered(kind)
         return None
 
     def __parse_nonref_properties_result(
         self,
         properties: properties_pb2.Properties,
     ) -> dict:
-        return {
-            name: self.__deserialize_non_ref_prop(value)
-            for name, value in properties.fields.items()
-        }
+        # bind once, the comprehension would otherwise resolve the method for every field
+        deserialize = self.__deserialize_non_ref_prop
+        return {name: deserialize(value) for name, value in properties.fields.items()}
 
     def __parse_ref_properties_result(
         self,
@@ -257,14 +269,12 @@ class _BaseQuery(Generic[Properties, References]):
         if len(properties.ref_props) == 0:
             return {} if properties.ref_props_requested else None
 
+        to_object = self.__result_to_query_object
+        to_reference = _CrossReference._from
+        options = _REF_QUERY_OPTIONS
         return {
-            ref_prop.prop_name: _CrossReference._from(
-                [
-                    self.__result_to_query_object(
-                        prop, prop.metadata, _QueryOptions(True, True, True, True, False)
-                    )
-                    for prop in ref_prop.properties
-                ]
+            ref_prop.prop_name: to_reference(
+                [to_object(prop, prop.metadata, options) for prop in ref_prop.properties]
             )
             for ref_prop in properties.ref_props
         }
@@ -400,11 +410,9 @@ class _BaseQuery(Generic[Properties, References]):
         QueryReturn[TProperties, CrossReferences],
         QueryReturn[TProperties, TReferences],
     ]:
+        to_object = self.__result_to_query_object
         return QueryReturn(
-            objects=[
-                self.__result_to_query_object(obj.properties, obj.metadata, options)
-                for obj in res.results
-            ]
+            objects=[to_object(obj.properties, obj.metadata, options) for obj in res.results]
         )
 
     def _result_to_generative_query_return(
@@ -425,11 +433,9 @@ class _BaseQuery(Generic[Properties, References]):
         GenerativeReturn[TProperties, CrossReferences],
         GenerativeReturn[TProperties, TReferences],
     ]:
+        to_object = self.__result_to_generative_object
         return GenerativeReturn(
-            objects=[
-                self.__result_to_generative_object(obj.properties, obj.metadata, options)
-                for obj in res.results
-            ],
+            objects=[to_object(obj.properties, obj.metadata, options) for obj in res.results],
             generated=(
                 res.generative_grouped_result if res.generative_grouped_result != "" else None
             ),
@@ -463,13 +469,11 @@ class _BaseQuery(Generic[Properties, References]):
             ReturnReferences[TReferences]
         ],  # required until 3.12 is minimum supported version to use new generics syntax
     ) -> GroupByReturnType[Properties, References, TProperties, TReferences]:
-        groups = {
-            group.name: self.__result_to_group(group, options) for group in res.group_by_results
-        }
-        objects_group_by: List[GroupByObject] = [
-            obj for group in groups.values() for obj in group.objects
-        ]
-        return GroupByReturn(objects=objects_group_by, groups=groups)
+        groups = [self.__result_to_group(group, options) for group in res.group_by_results]
+        objects_group_by: List[GroupByObject] = [obj for group in groups for obj in group.objects]
+        return GroupByReturn(
+            objects=objects_group_by, groups={group.name: group for group in groups}
+        )
 
     def _result_to_generative_groupby_return(
         self,
@@ -489,26 +493,14 @@ class _BaseQuery(Generic[Properties, References]):
         GenerativeGroupByReturn[TProperties, CrossReferences],
         GenerativeGroupByReturn[TProperties, TReferences],
     ]:
-        groups = {
-            group.name: self.__result_to_generative_group(group, options)
-            for group in res.group_by_results
-        }
-        objects_group_by: List[GroupByObject] = [
-            GroupByObject(
-                collection=obj.collection,
-                properties=obj.properties,
-                references=obj.references,
-                metadata=obj.metadata,
-                belongs_to_group=group.name,
-                uuid=obj.uuid,
-                vector=obj.vector,
-            )
-            for group in groups.values()
-            for obj in group.objects
+        groups = [
+            self.__result_to_generative_group(group, options) for group in res.group_by_results
         ]
+        # the group objects are already GroupByObjects tagged with their group, no need to copy them
+        objects_group_by: List[GroupByObject] = [obj for group in groups for obj in group.objects]
         return GenerativeGroupByReturn(
             objects=objects_group_by,
-            groups=groups,
+            groups={group.name: group for group in groups},
             generated=(
                 res.generative_grouped_result if res.generative_grouped_result != "" else None
             ),
@@ -582,9 +574,16 @@ class _BaseQuery(Generic[Properties, References]):
             # cheaper than isinstance(), needs to be MetadataQuery
             ret_md = cast(MetadataQuery, return_metadata)
         else:
-            ret_md = MetadataQuery(**{str(prop): True for prop in return_metadata})
+            ret_md = _BaseQuery.__metadata_from_names(frozenset(return_metadata))
         return _MetadataQuery.from_public(ret_md, include_vector)
 
+    # the same metadata names are requested over and over, validate each selection only once.
+    # The cached models are shared, do not mutate them
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def __metadata_from_names(names: FrozenSet[str]) -> MetadataQuery:
+        return MetadataQuery(**{str(prop): True for prop in names})
+
     def _parse_return_references(
         self, return_references: Optional[ReturnReferences[TReferences]]
     ) -> Optional[REFERENCES]:
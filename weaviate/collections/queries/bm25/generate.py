@@ -106,7 +106,7 @@ class _BM25Generate(Generic[Properties, References], _BaseQuery[Properties, Refe
             return_metadata=self._parse_return_metadata(return_metadata, include_vector),
             return_properties=self._parse_return_properties(return_properties),
             return_references=self._parse_return_references(return_references),
-            generative=_Generative(
+            generative=_Generative.from_input(
                 single=single_prompt,
                 grouped=grouped_task,
                 grouped_properties=grouped_properties,
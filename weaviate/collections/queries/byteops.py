@@ -1,16 +1,28 @@
-import struct
-from typing import List
+import sys
+from array import array
+from typing import Any, List, Sequence, cast
 
 
 class _ByteOps:
+    @staticmethod
+    def encode_float32s(vector: Sequence[float]) -> bytes:
+        if hasattr(vector, "astype") and hasattr(vector, "tobytes"):
+            # numpy arrays are converted in a single copy instead of element by element
+            return cast(bytes, cast(Any, vector).astype("<f4", copy=False).tobytes())
+        floats = array("f", vector)
+        # vectors are sent little-endian, the same "<f4" layout that numpy arrays are encoded with
+        if sys.byteorder == "big":
+            floats.byteswap()
+        return floats.tobytes()
+
     @staticmethod
     def decode_float32s(byte_vector: bytes) -> List[float]:
-        return [float(val) for val in struct.unpack(f"{len(byte_vector)//4}f", byte_vector)]
+        return array("f", byte_vector).tolist()
 
     @staticmethod
     def decode_float64s(byte_vector: bytes) -> List[float]:
-        return [float(val) for val in struct.unpack(f"{len(byte_vector)//8}d", byte_vector)]
+        return array("d", byte_vector).tolist()
 
     @staticmethod
     def decode_int64s(byte_vector: bytes) -> List[int]:
-        return [int(val) for val in struct.unpack(f"{len(byte_vector)//8}q", byte_vector)]
+        return array("q", byte_vector).tolist()
@@ -1,6 +1,9 @@
+from datetime import datetime
 from typing import (
     Generic,
+    List,
     Optional,
+    Sequence,
     cast,
 )
 
@@ -9,6 +12,7 @@ from weaviate.collections.classes.filters import (
 )
 from weaviate.collections.classes.grpc import MetadataQuery
 from weaviate.collections.classes.internal import (
+    Object,
     ObjectSingleReturn,
     MetadataSingleObjectReturn,
     QuerySingleReturn,
@@ -19,6 +23,11 @@ from weaviate.collections.classes.internal import (
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _BaseQuery
 from weaviate.types import INCLUDE_VECTOR, UUID
+from weaviate.util import get_valid_uuid
+from weaviate.validator import _validate_input, _ValidateArgument
+
+# the metadata requested by a fetch is always the same, so the model is built once at import
+_FETCH_BY_ID_METADATA = MetadataQuery(creation_time=True, last_update_time=True, is_consistent=True)
 
 
 class _FetchObjectByIDQuery(Generic[Properties, References], _BaseQuery[Properties, References]):
@@ -53,9 +62,7 @@ class _FetchObjectByIDQuery(Generic[Properties, References], _BaseQuery[Properti
             `weaviate.exceptions.WeaviateInsertInvalidPropertyError`:
                 If a property is invalid. I.e., has name `id` or `vector`, which are reserved.
         """
-        return_metadata = MetadataQuery(
-            creation_time=True, last_update_time=True, is_consistent=True
-        )
+        return_metadata = _FETCH_BY_ID_METADATA
         res = self._query.get(
             limit=1,
             filters=Filter.by_id().equal(uuid),
@@ -78,12 +85,77 @@ class _FetchObjectByIDQuery(Generic[Properties, References], _BaseQuery[Properti
 
         if len(objects.objects) == 0:
             return None
+        return self.__to_single_return(objects.objects[0])
+
+    def fetch_objects_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+    ) -> List[Optional[QuerySingleReturn[Properties, References, TProperties, TReferences]]]:
+        """Retrieve several objects from the server by their UUIDs in a single query.
+
+        Arguments:
+            `uuids`
+                The UUIDs of the objects to retrieve, REQUIRED.
+            `include_vector`
+                Whether to include the vector in the returned objects.
+            `return_properties`
+                The properties to return for each object.
+            `return_references`
+                The references to return for each object.
+
+        Returns:
+            A list in the same order as `uuids`, with `None` for every UUID that does not exist.
+
+        Raises:
+            `weaviate.exceptions.WeaviateGRPCQueryError`:
+                If the network connection to Weaviate fails.
+            `weaviate.exceptions.WeaviateInsertInvalidPropertyError`:
+                If a property is invalid. I.e., has name `id` or `vector`, which are reserved.
+        """
+        if self._validate_arguments:
+            _validate_input(_ValidateArgument([Sequence[UUID]], "uuids", uuids))
+        if len(uuids) == 0:
+            return []
+        ids = [get_valid_uuid(uuid) for uuid in uuids]
+        return_metadata = _FETCH_BY_ID_METADATA
+        res = self._query.get(
+            limit=len(ids),
+            filters=Filter.by_id().contains_any(ids),
+            return_metadata=self._parse_return_metadata(return_metadata, include_vector),
+            return_properties=self._parse_return_properties(return_properties),
+            return_references=self._parse_return_references(return_references),
+        )
+        objects = self._result_to_query_return(
+            res,
+            _QueryOptions.from_input(
+                return_metadata,
+                return_properties,
+                include_vector,
+                self._references,
+                return_references,
+            ),
+            return_properties,
+            None,
+        )
 
-        obj = objects.objects[0]
-        assert obj.metadata is not None
-        assert obj.metadata.creation_time is not None
-        assert obj.metadata.last_update_time is not None
+        by_id = {str(obj.uuid): obj for obj in objects.objects}
+        ret: List[
+            Optional[QuerySingleReturn[Properties, References, TProperties, TReferences]]
+        ] = []
+        for id_ in ids:
+            obj = by_id.get(id_)
+            ret.append(None if obj is None else self.__to_single_return(obj))
+        return ret
 
+    def __to_single_return(
+        self, obj: Object
+    ) -> QuerySingleReturn[Properties, References, TProperties, TReferences]:
+        # both times are always requested by _FETCH_BY_ID_METADATA, so they are never None here
+        metadata = obj.metadata
         return cast(
             QuerySingleReturn[Properties, References, TProperties, TReferences],
             ObjectSingleReturn(
@@ -91,9 +163,9 @@ class _FetchObjectByIDQuery(Generic[Properties, References], _BaseQuery[Properti
                 vector=obj.vector,
                 properties=obj.properties,
                 metadata=MetadataSingleObjectReturn(
-                    creation_time=obj.metadata.creation_time,
-                    last_update_time=obj.metadata.last_update_time,
-                    is_consistent=obj.metadata.is_consistent,
+                    creation_time=cast(datetime, metadata.creation_time),
+                    last_update_time=cast(datetime, metadata.last_update_time),
+                    is_consistent=metadata.is_consistent,
                 ),
                 references=obj.references,
                 collection=obj.collection,
@@ -1,7 +1,9 @@
 from typing import (
     Generic,
+    List,
     Literal,
     Optional,
+    Sequence,
     Type,
     overload,
 )
@@ -70,3 +72,57 @@ class _FetchObjectByIDQuery(Generic[Properties, References], _BaseQuery[Properti
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
     ) -> ObjectSingleReturn[TProperties, TReferences]: ...
+    @overload
+    def fetch_objects_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None,
+    ) -> List[Optional[ObjectSingleReturn[Properties, References]]]: ...
+    @overload
+    def fetch_objects_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES,
+    ) -> List[Optional[ObjectSingleReturn[Properties, CrossReferences]]]: ...
+    @overload
+    def fetch_objects_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences],
+    ) -> List[Optional[ObjectSingleReturn[Properties, TReferences]]]: ...
+    @overload
+    def fetch_objects_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+    ) -> List[Optional[ObjectSingleReturn[TProperties, References]]]: ...
+    @overload
+    def fetch_objects_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+    ) -> List[Optional[ObjectSingleReturn[TProperties, CrossReferences]]]: ...
+    @overload
+    def fetch_objects_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+    ) -> List[Optional[ObjectSingleReturn[TProperties, TReferences]]]: ...
@@ -82,7 +82,7 @@ class _FetchObjectsGenerate(Generic[Properties, References], _BaseQuery[Properti
             return_metadata=self._parse_return_metadata(return_metadata, include_vector),
             return_properties=self._parse_return_properties(return_properties),
             return_references=self._parse_return_references(return_references),
-            generative=_Generative(
+            generative=_Generative.from_input(
                 single=single_prompt,
                 grouped=grouped_task,
                 grouped_properties=grouped_properties,
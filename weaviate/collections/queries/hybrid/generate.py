@@ -127,7 +127,7 @@ class _HybridGenerate(Generic[Properties, References], _BaseQuery[Properties, Re
             return_metadata=self._parse_return_metadata(return_metadata, include_vector),
             return_properties=self._parse_return_properties(return_properties),
             return_references=self._parse_return_references(return_references),
-            generative=_Generative(
+            generative=_Generative.from_input(
                 single=single_prompt,
                 grouped=grouped_task,
                 grouped_properties=grouped_properties,
@@ -103,7 +103,7 @@ class _NearMediaGenerate(Generic[Properties, References], _BaseQuery[Properties,
             group_by=_GroupBy.from_input(group_by),
             rerank=rerank,
             target_vector=target_vector,
-            generative=_Generative(
+            generative=_Generative.from_input(
                 single=single_prompt,
                 grouped=grouped_task,
                 grouped_properties=grouped_properties,
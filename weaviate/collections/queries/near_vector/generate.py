@@ -92,7 +92,7 @@ class _NearVectorGenerate(Generic[Properties, References], _BaseQuery[Properties
             distance=distance,
             filters=filters,
             group_by=_GroupBy.from_input(group_by),
-            generative=_Generative(
+            generative=_Generative.from_input(
                 single=single_prompt,
                 grouped=grouped_task,
                 grouped_properties=grouped_properties,
@@ -9,6 +9,15 @@ class ConnectionConfig:
     session_pool_connections: int = 20
     session_pool_maxsize: int = 100
     session_pool_max_retries: int = 3
+    # gRPC channels to spread requests over round-robin, each with its own connection, disabled by
+    # default as it multiplies the connections every client opens to the server
+    grpc_channel_pool_size: int = 1
+    # replies of near_object and near_media searches to reuse for identical requests, disabled by
+    # default because a cached reply does not reflect writes made after it was fetched
+    search_cache_size: int = 0
+    # seconds for which len(collection) reuses the last object count instead of aggregating again,
+    # disabled by default as the count does not reflect writes made in the meantime
+    collection_length_cache_ttl: float = 0.0
 
     def __post_init__(self) -> None:
         if not isinstance(self.session_pool_connections, int):
@@ -23,6 +32,30 @@ class ConnectionConfig:
             raise TypeError(
                 f"session_pool_max_retries must be {int}, received {type(self.session_pool_max_retries)}"
             )
+        if not isinstance(self.grpc_channel_pool_size, int):
+            raise TypeError(
+                f"grpc_channel_pool_size must be {int}, received {type(self.grpc_channel_pool_size)}"
+            )
+        if self.grpc_channel_pool_size < 1:
+            raise ValueError(
+                f"grpc_channel_pool_size must be at least 1, received {self.grpc_channel_pool_size}"
+            )
+        if not isinstance(self.search_cache_size, int):
+            raise TypeError(
+                f"search_cache_size must be {int}, received {type(self.search_cache_size)}"
+            )
+        if self.search_cache_size < 0:
+            raise ValueError(
+                f"search_cache_size must not be negative, received {self.search_cache_size}"
+            )
+        if not isinstance(self.collection_length_cache_ttl, (int, float)):
+            raise TypeError(
+                f"collection_length_cache_ttl must be {float}, received {type(self.collection_length_cache_ttl)}"
+            )
+        if self.collection_length_cache_ttl < 0:
+            raise ValueError(
+                f"collection_length_cache_ttl must not be negative, received {self.collection_length_cache_ttl}"
+            )
 
 
 # used in v3 only
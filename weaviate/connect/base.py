@@ -110,15 +110,25 @@ class ConnectionParams(BaseModel):
         return f"{self.grpc.host}:{self.grpc.port}"
 
     @overload
-    def _grpc_channel(self, async_channel: Literal[False], proxies: Dict[str, str]) -> Channel:
+    def _grpc_channel(
+        self,
+        async_channel: Literal[False],
+        proxies: Dict[str, str],
+        local_subchannel_pool: bool = False,
+    ) -> Channel:
         ...
 
     @overload
-    def _grpc_channel(self, async_channel: Literal[True], proxies: Dict[str, str]) -> AsyncChannel:
+    def _grpc_channel(
+        self,
+        async_channel: Literal[True],
+        proxies: Dict[str, str],
+        local_subchannel_pool: bool = False,
+    ) -> AsyncChannel:
         ...
 
     def _grpc_channel(
-        self, async_channel: bool, proxies: Dict[str, str]
+        self, async_channel: bool, proxies: Dict[str, str], local_subchannel_pool: bool = False
     ) -> Union[Channel, AsyncChannel]:
         if async_channel:
             import_path = grpc.aio
@@ -129,6 +139,10 @@ class ConnectionParams(BaseModel):
             options: list = [*GRPC_DEFAULT_OPTIONS, ("grpc.http_proxy", p)]
         else:
             options = GRPC_DEFAULT_OPTIONS
+        if local_subchannel_pool:
+            # channels with identical arguments share one subchannel (and TCP connection) through
+            # the global pool, a local pool gives each channel its own connection
+            options = [*options, ("grpc.use_local_subchannel_pool", 1)]
         if self.grpc.secure:
             return import_path.secure_channel(
                 target=self._grpc_target,
@@ -3,13 +3,26 @@ from __future__ import annotations
 import time
 from copy import copy
 from dataclasses import dataclass, field
+from itertools import cycle
 from threading import Thread, Event
-from typing import Any, Dict, List, Literal, Optional, Tuple, Union, cast, overload
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+    overload,
+)
 
 from authlib.integrations.httpx_client import AsyncOAuth2Client, OAuth2Client  # type: ignore
 from grpc import _channel, Channel  # type: ignore
 from grpc.aio import Channel as AsyncChannel  # type: ignore
 from grpc_health.v1 import health_pb2  # type: ignore
+from google.protobuf.internal import api_implementation
 from httpx import (
     AsyncClient,
     AsyncHTTPTransport,
@@ -51,12 +64,13 @@ from weaviate.exceptions import (
     WeaviateClosedClientError,
     WeaviateConnectionError,
 )
-from weaviate.proto.v1 import weaviate_pb2_grpc
+from weaviate.proto.v1 import search_get_pb2, weaviate_pb2_grpc
 from weaviate.util import (
     is_weaviate_domain,
     is_weaviate_client_too_old,
     PYPI_PACKAGE_URL,
     _decode_json_response_dict,
+    _LRUCache,
     _ServerVersion,
 )
 from weaviate.validator import _ValidateArgument, _validate_input
@@ -103,9 +117,10 @@ class _Connection(_ConnectionBase):
         self.__additional_headers = {}
         self._auth = auth_client_secret
         self._connection_params = connection_params
-        self._grpc_stub: Optional[weaviate_pb2_grpc.WeaviateStub] = None
+        self._grpc_stubs: List[weaviate_pb2_grpc.WeaviateStub] = []
+        self._grpc_stubs_cycle: Optional[Iterator[weaviate_pb2_grpc.WeaviateStub]] = None
         self._grpc_stub_async: Optional[weaviate_pb2_grpc.WeaviateStub] = None
-        self._grpc_channel: Optional[Channel] = None
+        self._grpc_channels: List[Channel] = []
         self._grpc_channel_async: Optional[AsyncChannel] = None
         self.timeout_config = timeout_config
         self.__connection_config = connection_config
@@ -406,8 +421,11 @@ class _Connection(_ConnectionBase):
 
         if hasattr(self, "_client"):
             self._client.close()
-        if self._grpc_channel is not None:
-            self._grpc_channel.close()
+        for channel in self._grpc_channels:
+            channel.close()
+        self._grpc_channels = []
+        self._grpc_stubs = []
+        self._grpc_stubs_cycle = None
         if self.embedded_db is not None:
             self.embedded_db.stop()
         self.__connected = False
@@ -655,6 +673,13 @@ class ConnectionV4(_Connection):
             connection_config,
             embedded_db,
         )
+        self.__grpc_channel_pool_size = connection_config.grpc_channel_pool_size
+        self._search_cache: Optional[_LRUCache[bytes, search_get_pb2.SearchReply]] = (
+            _LRUCache(connection_config.search_cache_size)
+            if connection_config.search_cache_size > 0
+            else None
+        )
+        self._collection_length_cache_ttl = connection_config.collection_length_cache_ttl
         self._prepare_grpc_headers()
 
     def _prepare_grpc_headers(self) -> None:
@@ -666,7 +691,7 @@ class ConnectionV4(_Connection):
 
         if self._auth is not None:
             if isinstance(self._auth, AuthApiKey):
-                self.__metadata_list.append(("authorization", self._auth.api_key))
+                self.__metadata_list.append(("authorization", "Bearer " + self._auth.api_key))
             else:
                 self.__metadata_list.append(
                     ("authorization", "dummy_will_be_refreshed_for_each_call")
@@ -676,24 +701,31 @@ class ConnectionV4(_Connection):
             self.__grpc_headers: Optional[Tuple[Tuple[str, str], ...]] = tuple(self.__metadata_list)
         else:
             self.__grpc_headers = None
+        self.__grpc_headers_token: Optional[str] = None
 
     def grpc_headers(self) -> Optional[Tuple[Tuple[str, str], ...]]:
-        if self._auth is None or not isinstance(self._auth, AuthApiKey):
+        # without auth or with an API key the headers never change and are built once
+        if self._auth is None or isinstance(self._auth, AuthApiKey):
             return self.__grpc_headers
 
-        assert self.__grpc_headers is not None
         access_token = self.get_current_bearer_token()
-        # auth is last entry in list, rest is static
-        self.__metadata_list[len(self.__metadata_list) - 1] = ("authorization", access_token)
-        return tuple(self.__metadata_list)
+        # only rebuild the headers when the token was refreshed in the meantime
+        if access_token != self.__grpc_headers_token:
+            # auth is last entry in list, rest is static
+            self.__metadata_list[len(self.__metadata_list) - 1] = ("authorization", access_token)
+            # without a token (OIDC configured, but disabled on the server) no auth header is sent
+            metadata = self.__metadata_list if len(access_token) > 0 else self.__metadata_list[:-1]
+            self.__grpc_headers = tuple(metadata) if len(metadata) > 0 else None
+            self.__grpc_headers_token = access_token
+        return self.__grpc_headers
 
     def _ping_grpc(self) -> None:
         """Performs a grpc health check and raises WeaviateGRPCUnavailableError if not."""
         if not self.is_connected():
             raise WeaviateClosedClientError()
-        assert self._grpc_channel is not None
+        assert len(self._grpc_channels) > 0
         try:
-            res: health_pb2.HealthCheckResponse = self._grpc_channel.unary_unary(
+            res: health_pb2.HealthCheckResponse = self._grpc_channels[0].unary_unary(
                 "/grpc.health.v1.Health/Check",
                 request_serializer=health_pb2.HealthCheckRequest.SerializeToString,
                 response_deserializer=health_pb2.HealthCheckResponse.FromString,
@@ -709,15 +741,27 @@ class ConnectionV4(_Connection):
 
     def connect(self, skip_init_checks: bool) -> None:
         super().connect(skip_init_checks)
-        # create GRPC channel. If Weaviate does not support GRPC then error now.
-        self._grpc_channel = self._connection_params._grpc_channel(
-            async_channel=False, proxies=self._proxies
-        )
-        assert self._grpc_channel is not None
-        self._grpc_stub = weaviate_pb2_grpc.WeaviateStub(self._grpc_channel)
+        # create GRPC channels. If Weaviate does not support GRPC then error now.
+        # Requests are spread round-robin over several channels, each with its own TCP connection, so
+        # that concurrent calls do not queue behind each other on a single HTTP/2 connection.
+        pool_size = self.__grpc_channel_pool_size
+        self._grpc_channels = [
+            self._connection_params._grpc_channel(
+                async_channel=False, proxies=self._proxies, local_subchannel_pool=pool_size > 1
+            )
+            for _ in range(pool_size)
+        ]
+        self._grpc_stubs = [
+            weaviate_pb2_grpc.WeaviateStub(channel) for channel in self._grpc_channels
+        ]
+        self._grpc_stubs_cycle = cycle(self._grpc_stubs)
         if not skip_init_checks:
             self._ping_grpc()
 
+        # every query and batch goes through protobuf, make sure it is not running its slow fallback
+        if api_implementation.Type() == "python":
+            _Warnings.grpc_pure_python_protobuf()
+
         # do it after all other init checks so as not to break all the tests
         if self._weaviate_version.is_lower_than(1, 23, 7):
             raise WeaviateStartUpError(
@@ -728,7 +772,9 @@ class ConnectionV4(_Connection):
     def grpc_stub(self) -> Optional[weaviate_pb2_grpc.WeaviateStub]:
         if not self.is_connected():
             raise WeaviateClosedClientError()
-        return self._grpc_stub
+        if self._grpc_stubs_cycle is None:
+            return None
+        return next(self._grpc_stubs_cycle)
 
     @property
     def agrpc_stub(self) -> Optional[weaviate_pb2_grpc.WeaviateStub]:
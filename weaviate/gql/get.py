@@ -123,22 +123,31 @@ class AdditionalProperties:
     explainScore: bool = False
 
     def __str__(self) -> str:
-        additional_props: List[str] = []
-        cls_fields: Tuple[Field, ...] = fields(self.__class__)
-        for field in cls_fields:
-            if issubclass(field.type, bool):
-                enabled: bool = getattr(self, field.name)
-                if enabled:
-                    name = field.name
-                    if field.name == "uuid":  # id is reserved python name
-                        name = "id"
-                    additional_props.append(name)
+        additional_props = [
+            name for field, name in _bool_field_names(type(self)) if getattr(self, field)
+        ]
         if len(additional_props) > 0:
             return " _additional{" + " ".join(additional_props) + "} "
         else:
             return ""
 
 
+# the fields of a class never change, so resolve which ones are flags (and their GraphQL names) once
+_BOOL_FIELD_NAMES_CACHE: Dict[type, Tuple[Tuple[str, str], ...]] = {}
+
+
+def _bool_field_names(cls: type) -> Tuple[Tuple[str, str], ...]:
+    names = _BOOL_FIELD_NAMES_CACHE.get(cls)
+    if names is None:
+        cls_fields: Tuple[Field, ...] = fields(cls)
+        names = _BOOL_FIELD_NAMES_CACHE[cls] = tuple(
+            (field.name, "id" if field.name == "uuid" else field.name)  # id is reserved python name
+            for field in cls_fields
+            if issubclass(field.type, bool)
+        )
+    return names
+
+
 class GetBuilder(GraphQL):
     """
     GetBuilder class used to create GraphQL queries.
@@ -6,11 +6,27 @@ import base64
 import datetime
 import io
 import json
+import mmap
 import os
 import re
+from collections import OrderedDict
 from enum import Enum, EnumMeta
 from pathlib import Path
-from typing import Union, Sequence, Any, Optional, List, Dict, Generator, Tuple, cast
+from threading import Lock
+from typing import (
+    Union,
+    Sequence,
+    Any,
+    Optional,
+    List,
+    Dict,
+    Generator,
+    Generic,
+    Hashable,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 import requests
 import httpx
@@ -35,6 +51,9 @@ MINIMUM_NO_WARNING_VERSION = (
 )
 BYTES_PER_CHUNK = 65535  # The number of bytes to read per chunk when encoding files ~ 64kb
 
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
 
 # MetaEnum and BaseEnum are required to support `in` statements:
 #    'ALL' in ConsistencyLevel == True
@@ -124,43 +143,33 @@ def file_encoder_b64(file_or_file_path: Union[str, Path, io.BufferedReader]) ->
                 break
             yield data
 
-    should_close_file = False
-    use_buffering = True
-    file = None
-
-    try:
-        if isinstance(file_or_file_path, str):
-            if not os.path.isfile(file_or_file_path):
-                raise ValueError("No file found at location " + file_or_file_path)
-            file = open(file_or_file_path, "br")
-            should_close_file = True
-            use_buffering = os.path.getsize(file_or_file_path) > BYTES_PER_CHUNK
-        elif isinstance(file_or_file_path, Path):
-            if not file_or_file_path.is_file():
-                raise ValueError("No file found at location " + str(file_or_file_path))
-            file = file_or_file_path.open("br")
-            should_close_file = True
-            use_buffering = file_or_file_path.stat().st_size > BYTES_PER_CHUNK
-        elif isinstance(file_or_file_path, io.BufferedReader):
-            file = file_or_file_path
-        else:
-            raise TypeError(
-                '"file_or_file_path" should be a file path or a binary read file'
-                " (io.BufferedReader)"
-            )
-
-        if use_buffering:
-            encoded: str = ""
-            for chunk in _chunks(file, BYTES_PER_CHUNK):
-                encoded += base64.b64encode(chunk).decode("utf-8")
-        else:
-            encoded = base64.b64encode(file.read()).decode("utf-8")
+    if isinstance(file_or_file_path, str):
+        if not os.path.isfile(file_or_file_path):
+            raise ValueError("No file found at location " + file_or_file_path)
+        return _encode_file_at_path_b64(file_or_file_path)
+    elif isinstance(file_or_file_path, Path):
+        if not file_or_file_path.is_file():
+            raise ValueError("No file found at location " + str(file_or_file_path))
+        return _encode_file_at_path_b64(file_or_file_path)
+    elif isinstance(file_or_file_path, io.BufferedReader):
+        # the chunk size is a multiple of 3 so the encoded chunks can be joined without padding
+        return "".join(
+            base64.b64encode(chunk).decode("utf-8")
+            for chunk in _chunks(file_or_file_path, BYTES_PER_CHUNK)
+        )
+    else:
+        raise TypeError(
+            '"file_or_file_path" should be a file path or a binary read file (io.BufferedReader)'
+        )
 
-    finally:
-        if should_close_file and file is not None:
-            file.close()
 
-    return encoded
+def _encode_file_at_path_b64(path: Union[str, Path]) -> str:
+    with open(path, "br") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return ""
+        # map the file instead of reading it so that the only full-size allocation is the encoded output
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return base64.b64encode(mapped).decode("utf-8")
 
 
 def image_decoder_b64(encoded_image: str) -> bytes:
@@ -402,10 +411,9 @@ def get_valid_uuid(uuid: Union[str, uuid_lib.UUID]) -> str:
     if not isinstance(uuid, str):
         raise TypeError("'uuid' must be of type str or uuid.UUID, but was: " + str(type(uuid)))
 
-    _is_weaviate_url = is_weaviate_object_url(uuid)
-    _is_object_url = is_object_url(uuid)
     _uuid = uuid
-    if _is_weaviate_url or _is_object_url:
+    # bare UUIDs are by far the most common input and can never be a beacon or an object URL
+    if "/" in uuid and (is_weaviate_object_url(uuid) or is_object_url(uuid)):
         _uuid = uuid.split("/")[-1]
     try:
         _uuid = str(uuid_lib.UUID(_uuid))
@@ -810,6 +818,36 @@ class _ServerVersion:
         return self >= _ServerVersion(1, 25, 0)
 
 
+class _LRUCache(Generic[K, V]):
+    """A thread-safe mapping that evicts the least recently used entry once `maxsize` is reached."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.__maxsize = maxsize
+        self.__entries: "OrderedDict[K, V]" = OrderedDict()
+        self.__lock = Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        with self.__lock:
+            value = self.__entries.get(key)
+            if value is not None:
+                self.__entries.move_to_end(key)
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        with self.__lock:
+            self.__entries[key] = value
+            self.__entries.move_to_end(key)
+            if len(self.__entries) > self.__maxsize:
+                self.__entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+
 def is_weaviate_too_old(current_version_str: str) -> bool:
     """
     Check if the user should be gently nudged to upgrade their Weaviate server version.
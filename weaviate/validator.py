@@ -38,11 +38,14 @@ def __is_valid(expected: Any, value: Any) -> bool:
     ):
         if not isinstance(value, Sequence) and not isinstance(value, list):
             return False
+        # a str is a Sequence of str too, but never a valid value for a sequence of items
+        if isinstance(value, str):
+            return False
         args = get_args(expected)
         if len(args) == 1:
             if get_origin(args[0]) is Union:
                 union_args = get_args(args[0])
-                return any(isinstance(val, union_arg) for val in value for union_arg in union_args)
+                return all(any(isinstance(val, arg) for arg in union_args) for val in value)
             else:
                 return all(isinstance(val, args[0]) for val in value)
     return isinstance(value, expected)
@@ -271,3 +271,13 @@ class _Warnings:
             category=UserWarning,
             stacklevel=1,
         )
+
+    @staticmethod
+    def grpc_pure_python_protobuf() -> None:
+        warnings.warn(
+            message="""Grpc003: protobuf is running its pure-python implementation, which makes encoding and decoding
+            every gRPC query and batch many times slower. Make sure protobuf>=4.21.6 is installed from a wheel for
+            your platform and that PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION is not set to "python".""",
+            category=UserWarning,
+            stacklevel=1,
+        )